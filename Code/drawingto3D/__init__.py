@@ -9,8 +9,30 @@ surface area of a drawn location on the 3D model.
 
 Modules
 -------
+benchmark :
+    Measures the run time of the drawing to 3D pipeline.
 data_manager :
     Converts input mesh data to python usable data tables.
+distance_cache :
+    Keeps recently solved distance fields so they can be reused.
+exact_geodesic :
+    Finds exact polyhedral geodesic distances with window propagation.
 geodesic_path.py :
     Finds the geodesic path between sets of points on a mesh
+instrumentation :
+    Times the stages of the drawing to 3D pipeline when turned on.
+landmark_index :
+    Gives fast bounds on geodesic distances from precomputed landmark fields.
+mesh_registry :
+    Shares loaded meshes between every user in a process.
+path_store :
+    Stores many geodesic paths in two flat arrays.
+service :
+    Answers geodesic queries from asyncio code without blocking the event loop.
+
+Notes
+-----
+Only numpy is imported when the package is imported. polars, potpourri3d,
+pyvista, and scipy are imported inside the functions that use them, so a job
+that only finds distances never pays for importing pyvista and VTK.
 '''
@@ -0,0 +1,533 @@
+'''
+Measures the run time of the drawing to 3D pipeline.
+
+Times the main steps of finding geodesic distances, paths, and surfaces so
+that changes to the code can be checked for speed ups or slow downs.
+
+Classes
+-------
+BenchmarkRegression : Raised when a stage is slower than its baseline.
+
+Methods
+-------
+benchmark_combine_uv_arrays :
+    Checks and times combining UV maps against per map table concatenation.
+benchmark_distance_methods :
+    Compares the run time and accuracy of each distance method.
+benchmark_enclosed_uvs :
+    Times the bounding box culled UV containment test against a full scan.
+benchmark_resolution_levels :
+    Reports the distance error and speed of each mesh resolution level.
+benchmark_shared_starts :
+    Times batched and row by row distance solves as more starts are shared.
+benchmark_startup :
+    Times importing the package and finding a first distance from cold.
+compare_to_baseline :
+    Checks benchmark results against saved baseline results.
+make_centroid_data :
+    Makes random start and end centroid pixels on a location drawing.
+make_cylinder_mesh :
+    Makes a UV mapped cylinder mesh to stand in for an arm.
+make_drawing_borders :
+    Makes random closed location drawing borders.
+run_benchmarks :
+    Times every stage of the pipeline on generated meshes.
+
+Notes
+-----
+`run_benchmarks` only uses generated meshes and data, so it runs without the
+saved arm meshes or any network access. The other benchmarks take real mesh
+data. Use the same mesh and data for every run being compared.
+
+Run the full suite from the command line with
+``python -m drawingto3D.benchmark [baseline_file] [--save-baseline]
+[--tolerance TOLERANCE] [--repeats REPEATS]``. It prints the results and
+exits with status 1 if any stage is slower than the baseline or missing
+from the results.
+'''
+from __future__ import annotations
+import numpy as np
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import polars as pl
+    import potpourri3d as pp3d
+
+
+class BenchmarkRegression(RuntimeError):
+    '''
+    Raised when a stage is slower than its baseline.
+
+    The message lists each stage that regressed with its baseline and new
+    median latency.
+    '''
+    pass
+
+
+def benchmark_combine_uv_arrays(moved_map_count: int = 4,
+                                radial_segments: int = 64,
+                                height_segments: int = 128,
+                                repeats: int = 3, seed: int = 0
+                                ) -> Dict[str, float]:
+    '''
+    Checks and times combining UV maps against per map table concatenation.
+
+    A base map is made with `make_cylinder_mesh` and each moved map is a copy
+    of its UVs shifted by a random offset, so some of its UVs fall outside of
+    the location drawing bounds. The maps are combined once with
+    `data_manager.combine_uv_arrays` and once as polars tables, keeping the
+    in bounds rows of each moved map with `data_manager.find_moved_uv_indicies`
+    and adding them to the base tables with one `pl.concat` per map. The
+    combined UV arrays and lookup tables of both are checked to be the same.
+
+    Parameters
+    ----------
+    moved_map_count : int, default: 4
+        The number of moved maps to add to the base map.
+    radial_segments : int, default: 64
+        The number of faces around the cylinder.
+    height_segments : int, default: 128
+        The number of faces along the cylinder.
+    repeats : int, default: 3
+        The number of times each timing is repeated. The fastest run is kept.
+    seed : int, default: 0
+        The seed for the random offsets.
+
+    Returns
+    -------
+    timings : Dict[str, float]
+        The seconds for the keys `concat_time` and `combined_time`, and
+        `speed_up`, the first divided by the second.
+
+    Raises
+    ------
+    AssertionError
+        If the two ways give different UV points, lookup pairs, or row order
+
+    See Also
+    --------
+    data_manager.combine_uv_arrays :
+        Combines UV arrays and lookup arrays in one preallocated pass.
+    '''
+    pass
+
+
+def benchmark_distance_methods(sex: str, side: str, data: np.ndarray,
+                               reference_method: str = "exact",
+                               repeats: int = 3) -> pl.DataFrame:
+    '''
+    Compares the run time and accuracy of each distance method.
+
+    Finds the distances of the same data with a `GeodesicPath` for each of the
+    `geodesic_path.DISTANCE_METHODS` and compares them to the distances of
+    the reference method.
+
+    Parameters
+    ----------
+    sex : str
+        The visual sex of the mesh (Male or Female)
+    side : str
+        The arm of the model (right or left)
+    data : np.ndarray
+        A Nx4 array of start x, start y, end x, and end y centroid pixel
+        values
+    reference_method : str, default: exact
+        The method the other methods are compared to. With exact, the errors
+        are relative to the true polyhedral geodesic distance.
+    repeats : int, default: 3
+        The number of times each timing is repeated. The fastest run is kept.
+
+    Returns
+    -------
+    results : pl.DataFrame
+        Table with a row for each method and the columns `method`, `time`,
+        `rows_per_second`, `mean_relative_error`, and `max_relative_error`.
+        Times are in seconds.
+
+    See Also
+    --------
+    GeodesicPath.calculate_distances :
+        Find the distance between the starting and ending points
+
+    Notes
+    -----
+    Only exact gives the true geodesic distance. heat is approximate,
+    edgeflip gives a local geodesic that can be longer than the shortest
+    one, and dijkstra is bounded below by the geodesic. The errors show how
+    far each method is from the reference, so with any other reference a
+    small error does not mean a method finds the shortest distance. Pick the
+    fastest method whose `max_relative_error` is within the tolerance of the
+    job.
+    '''
+    pass
+
+
+def benchmark_enclosed_uvs(uv_array: np.ndarray,
+                           clean_boundary_uv_arrays: Sequence[List[int]],
+                           repeats: int = 3) -> pl.DataFrame:
+    '''
+    Times the bounding box culled UV containment test against a full scan.
+
+    Each border is tested once by checking every UV in the map and once with
+    `surface.find_enclosed_uvs` using a KD Tree made ahead of time. The found
+    UVs of both methods are checked to be the same.
+
+    Parameters
+    ----------
+    uv_array : np.ndarray
+        Table of x, y positions of every uv point for the 3D mesh.
+    clean_boundary_uv_arrays : Sequence[List[int]]
+        The border of each location drawing as row numbers in the `uv_array`.
+    repeats : int, default: 3
+        The number of times each timing is repeated. The fastest run is kept.
+
+    Returns
+    -------
+    timings : pl.DataFrame
+        Table with a row for each border and the columns `border_size`,
+        `box_fraction`, `full_time`, `culled_time`, and `speed_up`, where
+        `box_fraction` is the fraction of UVs in the bounding box of the
+        border. Times are in seconds.
+
+    Raises
+    ------
+    AssertionError
+        If the two methods find different UVs for any border
+
+    See Also
+    --------
+    surface.find_enclosed_uvs : Find all UVs contained by the location drawing.
+    '''
+    pass
+
+
+def benchmark_resolution_levels(data: np.ndarray,
+                                data_path: str = "../Data",
+                                repeats: int = 3) -> pl.DataFrame:
+    '''
+    Reports the distance error and speed of each mesh resolution level.
+
+    Finds the distances of the same data on every saved level of the male and
+    female, left and right arm meshes and compares them to the distances on
+    the full mesh. The coarse to fine mode is reported as its own row.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        A Nx4 array of start x, start y, end x, and end y centroid pixel
+        values
+    data_path : str, default: ../Data
+        The relative path to the data folder containing the mesh data
+    repeats : int, default: 3
+        The number of times each timing is repeated. The fastest run is kept.
+
+    Returns
+    -------
+    report : pl.DataFrame
+        Table with a row for each mesh and level and the columns `mesh`,
+        `resolution`, `coarse_to_fine`, `verticies`, `load_time`,
+        `distance_time`, `speed_up`, `mean_relative_error`, and
+        `max_relative_error`. Times are in seconds.
+
+    See Also
+    --------
+    data_manager.get_mesh_data :
+        Saves out the mesh data from an obj file.
+    '''
+    pass
+
+
+def benchmark_shared_starts(distance_solver: pp3d.MeshHeatMethodDistanceSolver,
+                            vertex_count: int, row_count: int = 1000,
+                            shared_fractions: Sequence[float] = (
+                                0.0, 0.25, 0.5, 0.75, 1.0),
+                            repeats: int = 3, seed: int = 0) -> pl.DataFrame:
+    '''
+    Times batched and row by row distance solves as more starts are shared.
+
+    Makes random start and end vertex pairs where a set fraction of the rows
+    reuse a starting vertex from another row. For each fraction, the distances
+    are found once with one solve per row and once with one solve per unique
+    starting vertex.
+
+    Parameters
+    ----------
+    distance_solver : pp3d.MeshHeatMethodDistanceSolver
+        Heat method solver for the mesh.
+    vertex_count : int
+        The number of verticies in the mesh.
+    row_count : int, default: 1000
+        The number of start and end pairs to make for each fraction.
+    shared_fractions : Sequence[float], default: (0.0, 0.25, 0.5, 0.75, 1.0)
+        The fractions of rows that reuse an existing starting vertex.
+    repeats : int, default: 3
+        The number of times each timing is repeated. The fastest run is kept.
+    seed : int, default: 0
+        The seed for the random vertex pairs.
+
+    Returns
+    -------
+    timings : pl.DataFrame
+        Table with a row for each shared fraction and the columns
+        `shared_fraction`, `unique_starts`, `row_time`, `batched_time`, and
+        `speed_up`. Times are in seconds.
+
+    See Also
+    --------
+    GeodesicPath.calculate_distances :
+        Find the distance between the starting and ending points
+    '''
+    pass
+
+
+def benchmark_startup(sex: str = "male", side: str = "right",
+                      repeats: int = 5) -> Dict[str, float]:
+    '''
+    Times importing the package and finding a first distance from cold.
+
+    Each repeat starts a new python process so nothing is already imported or
+    loaded. The process times importing `drawingto3D`, making a
+    `GeodesicPath`, and finding the distance of one start and end pair.
+
+    Parameters
+    ----------
+    sex : str, default: male
+        The visual sex of the mesh (Male or Female)
+    side : str, default: right
+        The arm of the model (right or left)
+    repeats : int, default: 5
+        The number of new processes to time. The median of each time is kept.
+
+    Returns
+    -------
+    timings : Dict[str, float]
+        The median seconds for the keys `import`, `load_mesh`,
+        `first_distance`, and `total`, along with `heavy_modules`, the number
+        of polars, potpourri3d, pyvista, scipy, and vtk modules loaded by the
+        import alone.
+
+    See Also
+    --------
+    GeodesicPath.calculate_distances :
+        Find the distance between the starting and ending points
+    '''
+    pass
+
+
+def compare_to_baseline(results: pl.DataFrame, baseline_file: str,
+                        tolerance: float = 0.2) -> pl.DataFrame:
+    '''
+    Checks benchmark results against saved baseline results.
+
+    Parameters
+    ----------
+    results : pl.DataFrame
+        The results from `run_benchmarks`.
+    baseline_file : str
+        The path to the baseline results saved by `run_benchmarks`.
+    tolerance : float, default: 0.2
+        The largest allowed increase of the median latency of a stage as a
+        fraction of its baseline.
+
+    Returns
+    -------
+    comparison : pl.DataFrame
+        Table with a row for each stage and resolution in either result and
+        the columns `stage`, `resolution`, `baseline_p50`, `p50`, and
+        `change`. A stage missing from one of the results has a null in the
+        columns of that result.
+
+    Raises
+    ------
+    BenchmarkRegression
+        If the median latency of any stage grew by more than `tolerance`, or
+        if a stage and resolution of the baseline is missing from `results`
+
+    Notes
+    -----
+    A stage that is in the baseline but not in the new results counts as a
+    regression, so a stage that stops running or is renamed fails the check
+    instead of passing it. Stages only in the new results are reported and
+    pass, as they have nothing to compare to. Peak memory is reported but not
+    checked.
+    '''
+    pass
+
+
+def make_centroid_data(count: int, image_x_size: int = 400,
+                       image_y_size: int = 1000, shared_fraction: float = 0.5,
+                       seed: int = 0) -> np.ndarray:
+    '''
+    Makes random start and end centroid pixels on a location drawing.
+
+    Parameters
+    ----------
+    count : int
+        The number of rows to make.
+    image_x_size : int, default: 400
+        The x dimension of the location drawing image in pixels
+    image_y_size : int, default: 1000
+        The y dimension of the location drawing image in pixels
+    shared_fraction : float, default: 0.5
+        The fraction of rows that reuse the start of an earlier row.
+    seed : int, default: 0
+        The seed for the random pixels.
+
+    Returns
+    -------
+    data : np.ndarray
+        A Nx4 array of start x, start y, end x, and end y centroid pixel
+        values
+    '''
+    pass
+
+
+def make_cylinder_mesh(radial_segments: int = 64, height_segments: int = 128,
+                       radius: float = 4.0, height: float = 30.0
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                  np.ndarray, np.ndarray]:
+    '''
+    Makes a UV mapped cylinder mesh to stand in for an arm.
+
+    The cylinder is open at both ends and cut along one side to lay it flat
+    on the UV map, so the verticies along the cut have two UVs each, like the
+    seams on the arm meshes.
+
+    Parameters
+    ----------
+    radial_segments : int, default: 64
+        The number of faces around the cylinder.
+    height_segments : int, default: 128
+        The number of faces along the cylinder.
+    radius : float, default: 4.0
+        The radius of the cylinder.
+    height : float, default: 30.0
+        The length of the cylinder.
+
+    Returns
+    -------
+    verticies : np.ndarray
+        A Vx3 float64 array of each vertex value.
+    faces : np.ndarray
+        A Fx3 int64 array of the vertex row numbers of each face.
+    face_uvs : np.ndarray
+        A Fx3 int64 array of the UV row numbers of each face corner.
+    uv_array : np.ndarray
+        A Ux2 float64 array of the x and y positions of each UV point.
+    lookup_table : np.ndarray
+        A Nx2 int64 array of each pair of UV row number and vertex row number.
+
+    See Also
+    --------
+    data_manager.read_obj :
+        Reads the mesh and UV data from an OBJ file in one pass.
+
+    Notes
+    -----
+    The arrays are in the same layout as the ones from
+    `data_manager.read_obj`, so they can be passed to any function that takes
+    mesh data read from an OBJ file.
+    '''
+    pass
+
+
+def make_drawing_borders(count: int, image_x_size: int = 400,
+                         image_y_size: int = 1000, max_radius: float = 60.0,
+                         seed: int = 0) -> List[pl.DataFrame]:
+    '''
+    Makes random closed location drawing borders.
+
+    Each border is a star shaped loop of pixels around a random center with a
+    random radius at each angle.
+
+    Parameters
+    ----------
+    count : int
+        The number of borders to make.
+    image_x_size : int, default: 400
+        The x dimension of the location drawing image in pixels
+    image_y_size : int, default: 1000
+        The y dimension of the location drawing image in pixels
+    max_radius : float, default: 60.0
+        The largest distance in pixels from the center to the border.
+    seed : int, default: 0
+        The seed for the random borders.
+
+    Returns
+    -------
+    borders : List[pl.DataFrame]
+        The x and y pixel values of each border.
+    '''
+    pass
+
+
+def run_benchmarks(resolutions: Sequence[Tuple[int, int]] = (
+                       (32, 64), (64, 128), (128, 256)),
+                   row_count: int = 1000, drawing_count: int = 100,
+                   repeats: int = 5, baseline_file: Optional[str] = None,
+                   save_baseline: bool = False,
+                   tolerance: float = 0.2) -> pl.DataFrame:
+    '''
+    Times every stage of the pipeline on generated meshes.
+
+    For each resolution, a cylinder mesh is made with `make_cylinder_mesh`
+    and the loading, nearest UV lookup, distance, path, enclosed UV, and
+    surface stages are run on generated centroid data and drawing borders.
+
+    Parameters
+    ----------
+    resolutions : Sequence[Tuple[int, int]]
+        The radial and height segments of each mesh to test.
+    row_count : int, default: 1000
+        The number of centroid rows for the distance and lookup stages. The
+        path stage uses a tenth of the rows.
+    drawing_count : int, default: 100
+        The number of drawing borders for the surface stages.
+    repeats : int, default: 5
+        The number of times each stage is run.
+    baseline_file : str, optional
+        The path to a baseline results file. If given, the results are
+        compared to it with `compare_to_baseline`.
+    save_baseline : bool, default: False
+        If True, the results are saved to `baseline_file` instead of being
+        compared to it.
+    tolerance : float, default: 0.2
+        The largest allowed increase of the median latency of a stage as a
+        fraction of its baseline.
+
+    Returns
+    -------
+    results : pl.DataFrame
+        Table with a row for each stage and resolution and the columns
+        `stage`, `resolution`, `verticies`, `items`, `throughput`, `p50`,
+        `p95`, `p99`, and `peak_rss`. Latencies are in seconds per run,
+        throughput is in items per second, and peak memory is in bytes.
+
+    Raises
+    ------
+    BenchmarkRegression
+        If a baseline is compared to and any stage regressed
+    ImportError
+        If `psutil` is not installed
+
+    Notes
+    -----
+    The stages timed are `load_mesh`, `uv_to_vertex`, `calculate_distances`,
+    `calculate_paths`, `find_enclosed_uvs`, and `create_surface`.
+
+    The peak memory of each stage is the rise in the resident set size of a
+    new process that runs only that stage. The process is started with the
+    spawn method, builds the inputs of the stage, and then runs it while the
+    parent reads its resident set size with `psutil` every millisecond. The
+    `peak_rss` is the largest reading less the reading taken just before
+    the stage started. This counts the memory held inside potpourri3d, scipy,
+    and vtk, such as the solver operators, and does not depend on which
+    stages ran before. `psutil` works on Linux, macOS, and Windows. A rise
+    shorter than a millisecond can be missed, which only happens for stages
+    too small to matter.
+    '''
+    pass
+
+
+if __name__ == "__main__":
+    pass
@@ -10,17 +10,39 @@ vertex on the 3D mesh.
 
 Methods
 -------
+build_edge_graph : Makes a sparse graph of the edges of a mesh.
+build_uv_tree : Makes a KD Tree of the UV map for nearest UV searches.
+build_uv_vertex_map :
+    Makes array maps between UV row numbers and vertex row numbers.
+combine_uv_arrays :
+    Combines UV arrays and lookup arrays in one preallocated pass.
+compute_face_areas : Finds the surface area of every face of a mesh.
 create_combined_data :
     Takes separate UV maps and lookup tables and combines them.
+decimate_mesh : Makes a coarser copy of a mesh with its UV data kept matched.
+diff_mesh : Finds what changed between saved mesh data and new mesh data.
+extract_submesh :
+    Cuts out the part of a mesh within a distance of a set of verticies.
 find_moved_uv_indicies :
     Return only the UVs that are within the location drawing bounds.
 get_mesh_data :
     Saves out the mesh data from an obj file.
 load_mesh : Loads in the mesh and creates the geodesic solver.
+load_mesh_bundle : Memory maps the arrays of a mesh bundle.
+load_mesh_cache : Loads the prepared mesh structures from a mesh cache.
+mesh_cache_key : Makes the cache key of a saved mesh data file or bundle.
+npz_to_bundle : Converts a saved .npz mesh data file to a mesh bundle.
 obj_to_txt :
     Takes in an OBJ mesh file and converts it into a text file.
+pixels_to_uv_indicies :
+    Finds the nearest UV to each of a set of location drawing pixels.
+read_obj : Reads the mesh and UV data from an OBJ file in one pass.
+save_mesh_bundle : Saves mesh arrays as an uncompressed mesh bundle.
+save_mesh_cache : Saves the prepared mesh structures to a mesh cache.
 txt_to_dataframe :
     Parses 3D mesh file in text format into the UV data and face lookup table.
+update_mesh_bundle :
+    Updates a mesh bundle from a changed OBJ file, redoing only what changed.
 
 Notes
 -----
@@ -36,10 +58,212 @@ You may also note that face data is used twice. The face data is loaded by
 `potpourri3d` but it also parsed in `txt_to_dataframe` to return a lookup table
 for each UV on the 2D location drawing to each vertex on the 3D mesh.
 '''
+from __future__ import annotations
 import numpy as np
-import polars as pl
-from typing import List, Tuple
-import potpourri3d as pp3d
+from typing import (Any, Dict, List, Optional, Sequence, TYPE_CHECKING,
+                    Tuple, Union)
+
+if TYPE_CHECKING:
+    import polars as pl
+    import potpourri3d as pp3d
+    from scipy.sparse import csr_matrix
+    from scipy.spatial import cKDTree
+    from drawingto3D.mesh_registry import MeshRegistry
+
+MESH_BUNDLE_VERSION = 1
+'''
+int : The version of the mesh bundle layout. Bundles made with a different
+version can not be loaded and must be made again with `npz_to_bundle`.
+'''
+
+MESH_CACHE_VERSION = 1
+'''
+int : The version of the mesh cache layout. Caches made with a different
+version are ignored and rebuilt.
+'''
+
+
+def build_edge_graph(verticies: np.ndarray, faces: np.ndarray) -> csr_matrix:
+    '''
+    Makes a sparse graph of the edges of a mesh.
+
+    Parameters
+    ----------
+    verticies : np.ndarray
+        A Vx3 array of each vertex value.
+    faces : np.ndarray
+        A Fx3 array of the vertex row numbers of each face.
+
+    Returns
+    -------
+    edge_graph : csr_matrix
+        A symmetric VxV sparse matrix with the length of the edge between each
+        pair of connected verticies.
+
+    Notes
+    -----
+    The three edges of every face are stacked and sorted so each edge shared
+    by two faces is only kept once.
+    '''
+    pass
+
+
+def build_uv_tree(uv_array: np.ndarray) -> cKDTree:
+    '''
+    Makes a KD Tree of the UV map for nearest UV searches.
+
+    The tree only needs to be made once per mesh and can be reused for every
+    nearest UV search on that mesh.
+
+    Parameters
+    ----------
+    uv_array : np.ndarray
+        The x and y positions of each UV point mapped to the mesh.
+
+    Returns
+    -------
+    uv_tree : cKDTree
+        KD Tree of the UV points. The data index of the tree matches the row
+        number of `uv_array`.
+
+    See Also
+    --------
+    pixels_to_uv_indicies :
+        Finds the nearest UV to each of a set of location drawing pixels.
+    '''
+    pass
+
+
+def build_uv_vertex_map(lookup_data: Union[pl.DataFrame, np.ndarray],
+                        vertex_count: int
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Makes array maps between UV row numbers and vertex row numbers.
+
+    Parameters
+    ----------
+    lookup_data : pl.DataFrame or np.ndarray
+        The lookup table to match UV points with mesh verticies, either as the
+        `uv` and `vertex` table from `load_mesh` or as the Nx2 array from
+        `read_obj`.
+    vertex_count : int
+        The number of verticies in the mesh.
+
+    Returns
+    -------
+    uv_to_vertex : np.ndarray
+        A 1D int64 array where entry i is the vertex row number of UV row i.
+    vertex_uv_offsets : np.ndarray
+        A 1D int64 array of length `vertex_count` + 1. The UV row numbers of
+        vertex j are ``vertex_uvs[vertex_uv_offsets[j]:vertex_uv_offsets[j +
+        1]]``.
+    vertex_uvs : np.ndarray
+        A 1D int64 array of the UV row numbers of every vertex, grouped by
+        vertex.
+
+    Raises
+    ------
+    ValueError
+        If a UV row number is linked to more than one vertex
+
+    See Also
+    --------
+    create_combined_data :
+        Takes separate UV maps and lookup tables and combines them.
+    load_mesh : Loads in the mesh and creates the geodesic solver.
+
+    Notes
+    -----
+    Every UV belongs to one vertex, so the UV to vertex direction is a plain
+    array that is indexed with the UV row numbers. A vertex on a seam of the UV
+    map has more than one UV, so the vertex to UV direction is stored in a
+    compressed sparse row layout. Both maps are made once when the mesh is
+    loaded, after which looking up indicies is done with numpy fancy indexing
+    instead of filtering the lookup table.
+    '''
+    pass
+
+
+def combine_uv_arrays(base_uv_array: np.ndarray,
+                      base_lookup_table: np.ndarray,
+                      moved_uv_data: List[Tuple[np.ndarray, np.ndarray]]
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Combines UV arrays and lookup arrays in one preallocated pass.
+
+    Parameters
+    ----------
+    base_uv_array : np.ndarray
+        A Ux2 array of the UV points of the base map.
+    base_lookup_table : np.ndarray
+        A Nx2 array of UV row number and vertex row number pairs of the base
+        map, as returned by `read_obj`.
+    moved_uv_data : List[Tuple[np.ndarray, np.ndarray]]
+        The UV array and lookup array of each map to add to the base map.
+
+    Returns
+    -------
+    combined_uv_array : np.ndarray
+        The UV points of the base map followed by the in bounds UV points of
+        each moved map.
+    combined_lookup_table : np.ndarray
+        The lookup pairs of the base map followed by the pairs of each in
+        bounds moved UV, with the UV row numbers changed to their rows in
+        `combined_uv_array`.
+
+    See Also
+    --------
+    create_combined_data :
+        Takes separate UV maps and lookup tables and combines them.
+
+    Notes
+    -----
+    The in bounds mask of every moved map is found first, which gives the
+    size of the output, so both outputs are made once and each map is
+    copied into its slice of them. The new row number of each in bounds UV is
+    the row offset of its map plus its running count in the mask, found with
+    `np.cumsum`. Lookup pairs of UVs out of bounds are dropped with the same
+    mask. The work is linear in the total number of UVs and lookup pairs.
+
+    Nothing is written to disk. A bundle made from the combined arrays has to
+    be saved whole with `save_mesh_bundle`, or remade with `get_mesh_data`, so
+    that its `face_uvs`, `content_hash`, and coarse levels match the new UVs.
+
+    The output is checked against adding the in bounds rows of each moved map
+    to the base tables with `pl.concat` by
+    `benchmark.benchmark_combine_uv_arrays`.
+    '''
+    pass
+
+
+def compute_face_areas(verticies: np.ndarray,
+                       faces: np.ndarray) -> np.ndarray:
+    '''
+    Finds the surface area of every face of a mesh.
+
+    Parameters
+    ----------
+    verticies : np.ndarray
+        A Vx3 array of each vertex value.
+    faces : np.ndarray
+        A Fx3 array of the vertex row numbers of each face.
+
+    Returns
+    -------
+    face_areas : np.ndarray
+        A 1D float64 array of the area of each face in the order of `faces`.
+
+    See Also
+    --------
+    get_mesh_data :
+        Saves out the mesh data from an obj file.
+
+    Notes
+    -----
+    The area of each triangle is half the norm of the cross product of two of
+    its edges, found for all faces at once.
+    '''
+    pass
 
 
 def create_combined_data(base_uv_data: Tuple[pl.DataFrame, pl.DataFrame],
@@ -70,6 +294,8 @@ def create_combined_data(base_uv_data: Tuple[pl.DataFrame, pl.DataFrame],
 
     See Also
     --------
+    combine_uv_arrays :
+        Combines UV arrays and lookup arrays in one preallocated pass.
     find_moved_uv_indicies :
         Return only the UVs that are within the location drawing bounds.
     txt_to_dataframe :
@@ -82,6 +308,173 @@ def create_combined_data(base_uv_data: Tuple[pl.DataFrame, pl.DataFrame],
     and the vertex on the original mesh. This breaks the 1 to 1 relation ship
     (or 2 to 1 with border UVs) of a UV to vertex. These lookup values are
     appended to the end of the base map's lookup table.
+
+    The vertex of each moved UV is taken from a `build_uv_vertex_map` array of
+    the moved map by indexing it with the `moved_uv_indicies` instead of
+    joining the lookup tables.
+
+    The tables are converted to arrays and combined with `combine_uv_arrays`,
+    so the combined tables are only built once at the end instead of being
+    concatenated once per moved map.
+    '''
+    pass
+
+
+def decimate_mesh(verticies: np.ndarray, faces: np.ndarray,
+                  face_uvs: np.ndarray, uv_array: np.ndarray,
+                  target_fraction: float
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                             np.ndarray]:
+    '''
+    Makes a coarser copy of a mesh with its UV data kept matched.
+
+    Collapses edges with quadric error metrics until the number of faces is
+    close to the target. Every collapse is done on the mesh faces and the UV
+    faces together, so the lookup table of the coarse mesh still links each
+    UV to a vertex.
+
+    Parameters
+    ----------
+    verticies : np.ndarray
+        A Vx3 array of each vertex value.
+    faces : np.ndarray
+        A Fx3 array of the vertex row numbers of each face.
+    face_uvs : np.ndarray
+        A Fx3 array of the UV row numbers of each face corner.
+    uv_array : np.ndarray
+        A Ux2 array of the x and y positions of each UV point.
+    target_fraction : float
+        The fraction of the faces to keep, between 0 and 1.
+
+    Returns
+    -------
+    coarse_verticies : np.ndarray
+        The verticies of the coarse mesh.
+    coarse_faces : np.ndarray
+        The faces of the coarse mesh.
+    coarse_face_uvs : np.ndarray
+        The UV row numbers of each corner of the coarse faces.
+    coarse_uv_array : np.ndarray
+        The UV points of the coarse mesh.
+    coarse_lookup_table : np.ndarray
+        A Nx2 array of each pair of coarse UV row number and coarse vertex
+        row number, in the same layout as the one from `read_obj`.
+
+    Raises
+    ------
+    ValueError
+        If `target_fraction` is not between 0 and 1
+
+    See Also
+    --------
+    get_mesh_data :
+        Saves out the mesh data from an obj file.
+
+    Notes
+    -----
+    Edges on a seam of the UV map are only collapsed along the seam, and
+    edges on the border of the location drawing are never collapsed, so the
+    UV islands keep their outlines on the drawing.
+    '''
+    pass
+
+
+def diff_mesh(mesh_arrays: Dict[str, np.ndarray], verticies: np.ndarray,
+              faces: np.ndarray, face_uvs: np.ndarray,
+              uv_array: np.ndarray) -> Dict[str, Any]:
+    '''
+    Finds what changed between saved mesh data and new mesh data.
+
+    Parameters
+    ----------
+    mesh_arrays : Dict[str, np.ndarray]
+        The saved mesh arrays, such as those from `load_mesh_bundle`.
+    verticies : np.ndarray
+        The new Vx3 array of each vertex value.
+    faces : np.ndarray
+        The new Fx3 array of the vertex row numbers of each face.
+    face_uvs : np.ndarray
+        The new Fx3 array of the UV row numbers of each face corner.
+    uv_array : np.ndarray
+        The new Ux2 array of the UV points.
+
+    Returns
+    -------
+    mesh_diff : Dict[str, Any]
+        The differences with the keys:
+
+        geometry_changed : bool
+            True if the verticies or faces changed.
+        changed_uvs : np.ndarray
+            The new UV row numbers that are new or moved. Old and new UV
+            rows are matched through `face_uvs`, by the face corner each is
+            used at, and a row changed if its UV point is not the same as
+            the one at the same corner of the saved `face_uvs`.
+        removed_uvs : np.ndarray
+            The saved UV row numbers that are no longer used.
+        changed_islands : np.ndarray
+            The numbers of the UV islands that hold a changed or removed UV.
+        island_count : int
+            The number of UV islands in the new data.
+
+    See Also
+    --------
+    update_mesh_bundle :
+        Updates a mesh bundle from a changed OBJ file, redoing only what
+        changed.
+
+    Notes
+    -----
+    A UV island is a group of UVs connected through `face_uvs`. The islands
+    are labeled with `scipy.sparse.csgraph.connected_components` on the UV
+    edge graph. The geometry is compared exactly, so exporting the same mesh
+    again counts as unchanged as long as the vertex and face order is kept.
+    '''
+    pass
+
+
+def extract_submesh(verticies: np.ndarray, faces: np.ndarray,
+                    seed_verticies: np.ndarray, radius: float
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Cuts out the part of a mesh within a distance of a set of verticies.
+
+    Keeps every face with a corner within `radius` of the center of the seed
+    verticies and then only the connected piece of those faces that holds
+    the seed verticies.
+
+    Parameters
+    ----------
+    verticies : np.ndarray
+        A Vx3 array of each vertex value.
+    faces : np.ndarray
+        A Fx3 array of the vertex row numbers of each face.
+    seed_verticies : np.ndarray
+        The vertex row numbers that must be inside the submesh.
+    radius : float
+        The straight line distance from the center of the seed verticies to
+        keep faces within.
+
+    Returns
+    -------
+    sub_verticies : np.ndarray
+        A Sx3 array of the verticies of the submesh.
+    sub_faces : np.ndarray
+        A Gx3 array of the faces of the submesh using submesh row numbers.
+    vertex_map : np.ndarray
+        A 1D array of length S of the row number in `verticies` of each
+        submesh vertex.
+
+    Raises
+    ------
+    ValueError
+        If the seed verticies are not all in one connected piece of the
+        submesh. Use a larger `radius`.
+
+    See Also
+    --------
+    GeodesicPath.calculate_local_distances :
+        Finds distances by solving on a small region around each pair
     '''
     pass
 
@@ -132,12 +525,18 @@ def find_moved_uv_indicies(uv_data: pl.DataFrame) -> Tuple[np.ndarray,
     UVs that are in bounds will have a value from 0 to 1 for both the x and y
     values. This needs to be enforced by the individual making the separated UV
     maps or else this code will not work.
+
+    The bounds check is one numpy mask over the x and y columns, the same mask
+    `combine_uv_arrays` uses.
     '''
     pass
 
 
 def get_mesh_data(model_directory: str, obj_file: str,
-                  uv_data: pl.DataFrame, lookup_table: pl.DataFrame) -> None:
+                  uv_data: Optional[pl.DataFrame] = None,
+                  lookup_table: Optional[pl.DataFrame] = None,
+                  resolution_levels: Sequence[float] = (),
+                  bundle: bool = False) -> None:
     '''
     Saves out the mesh data from an obj file.
 
@@ -151,16 +550,33 @@ def get_mesh_data(model_directory: str, obj_file: str,
         in obj and text format.
     obj_file : str
         The name of the obj mesh file.
-    uv_data : pl.DataFrame
-        Table of the UV mapping of the mesh.
-    lookup_table
-        Table of the connections between each UV point and mesh verticies.
+    uv_data : pl.DataFrame, optional
+        Table of the UV mapping of the mesh. If not given, the UV data is read
+        from the OBJ file with `read_obj`.
+    lookup_table : pl.DataFrame, optional
+        Table of the connections between each UV point and mesh verticies,
+        with a row per face corner as returned by `txt_to_dataframe`. Must be
+        given if `uv_data` is given.
+    resolution_levels : Sequence[float], default: ()
+        The fraction of faces to keep for each coarser level of the mesh to
+        save, from finest to coarsest. Level 0 is always the full mesh, so
+        (0.25, 0.05) saves levels 1 and 2.
+    bundle : bool, default: False
+        If True, the mesh data is saved as a mesh bundle with
+        `save_mesh_bundle` instead of as a compressed .npz file.
+
+    Raises
+    ------
+    ValueError
+        If only one of `uv_data` and `lookup_table` is given or the
+        `resolution_levels` are not decreasing values between 0 and 1
 
     See Also
     --------
     create_combined_data :
         Takes separate UV maps and lookup tables and combines them.
     load_mesh : Loads in the mesh and creates the geodesic solver.
+    read_obj : Reads the mesh and UV data from an OBJ file in one pass.
     txt_to_dataframe :
         Parses 3D mesh file in text format into the UV data and face lookup
         table.
@@ -169,16 +585,39 @@ def get_mesh_data(model_directory: str, obj_file: str,
     -----
     The OBJ mesh data is used to extract the vertex table and the mesh faces.
     The text file is used by the `txt_to_dataframe` method to find the UV data
-    and the lookup table from each UV point to each vertex.
+    and the lookup table from each UV point to each vertex. When no UV data is
+    given, everything is taken from a single `read_obj` pass over the OBJ
+    file and no text file is needed.
+
+    The `lookup_table` is always saved in one layout, whichever way the mesh
+    was read: a Nx2 int64 array of each unique pair of UV row number and
+    vertex row number, the same as the one from `read_obj`. When a face row
+    table is given, its UV and vertex columns are reshaped to Fx3 and the
+    unique pairs are taken from them with `np.unique` over the rows.
+
+    Two face arrays are saved next to the faces so they do not need to be
+    found again when the mesh is loaded: `face_uvs`, the UV row number of
+    each face corner, and `face_areas`, the area of each face from
+    `compute_face_areas`. The `face_uvs` come from `read_obj`, or from the UV
+    columns of the face rows in the given `lookup_table`.
+
+    Each coarser level is made from the full mesh with `decimate_mesh` and
+    saved in the same .npz file with the level number added to the end of the
+    array names, such as `verticies_1` and `faces_1`. The
+    `resolution_levels` are saved as well, so `update_mesh_bundle` can make
+    the levels again.
     '''
     pass
 
 
 def load_mesh(mesh_name: str,
-              data_path: str = "../Data"
+              data_path: str = "../Data",
+              cache_directory: Optional[str] = None,
+              resolution: int = 0, make_solvers: bool = True
               ) -> Tuple[pp3d.MeshHeatMethodDistanceSolver,
                          pp3d.EdgeFlipGeodesicSolver,
-                         np.ndarray, pl.DataFrame]:
+                         np.ndarray, pl.DataFrame, cKDTree, np.ndarray,
+                         np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     '''
     Loads in the mesh and creates the geodesic solver
 
@@ -194,17 +633,54 @@ def load_mesh(mesh_name: str,
     data_path : str
         The relative path to the data folder containing the .npz file for the
         mesh data saved from `get_mesh_data`.
+    cache_directory : str, optional
+        The path to a folder to keep the mesh cache in. If given, the prepared
+        UV structures are loaded from the cache when it matches the loaded
+        .npz file or bundle and saved to it when it does not.
+    resolution : int, default: 0
+        The level of the mesh to load. Level 0 is the full mesh and higher
+        levels are the coarser levels saved by `get_mesh_data`.
+    make_solvers : bool, default: True
+        If False, the solvers are not made and None is returned in their
+        place. Making the solvers is most of the load time, so this is used
+        by processes that only need the UV structures.
 
     Returns
     -------
-    distance_solver : pp3d.MeshHeatMethodDistanceSolver
+    distance_solver : pp3d.MeshHeatMethodDistanceSolver or None
         Heat method solver for the mesh.
-    path_solver : pp3d.MeshHeatMethodDistanceSolver
+    path_solver : pp3d.MeshHeatMethodDistanceSolver or None
         Geodesic path solver for the mesh.
     uv_array : np.ndarry
         The x and y positions of each UV point mapped to the mesh.
     lookup_data : pl.DataFrame
-        The lookup table to match UV points with mesh verticies.
+        The lookup table to match UV points with mesh verticies, made from the
+        saved Nx2 `lookup_table` with the columns `uv` and `vertex`.
+    uv_tree : cKDTree
+        KD Tree of `uv_array` for nearest UV searches.
+    uv_to_vertex : np.ndarray
+        A 1D integer array of the vertex number of each UV row.
+    vertex_uv_offsets : np.ndarray
+        A 1D integer array of where the UV row numbers of each vertex start
+        in `vertex_uvs`, followed by the length of `vertex_uvs`.
+    vertex_uvs : np.ndarray
+        A 1D integer array of the UV row numbers of every vertex, grouped by
+        vertex. Verticies on a seam of the UV map have more than one.
+    face_uvs : np.ndarray
+        A Fx3 integer array of the UV row number of each face corner.
+    face_areas : np.ndarray
+        A 1D float64 array of the area of each face.
+
+    Raises
+    ------
+    ValueError
+        If the `resolution` level is not saved in the mesh data
+
+    Warns
+    -----
+    UserWarning
+        If a mesh bundle and a .npz file are both in the `data_path` and the
+        bundle was not made from the current .npz file
 
     Notes
     -----
@@ -214,6 +690,25 @@ def load_mesh(mesh_name: str,
     uses edge flips to show the path on the mesh [*]_. Note that this path
     may not be the shortest path, just a demonstration.
 
+    The UV KD Tree and both directions of the UV and vertex map are always
+    returned. Without a `cache_directory` they are built with `build_uv_tree`
+    and `build_uv_vertex_map` on every load. With one, they are loaded from
+    the cache when it matches the mesh data and built and saved to it when it
+    does not. The cache of each level is kept under the `mesh_cache_key` of
+    the loaded file and the level. The solvers hold compiled operators that
+    can not be saved, so they are always made from the mesh verticies and
+    faces.
+
+    If a mesh bundle saved by `save_mesh_bundle` is in the `data_path`, it is
+    used instead of the .npz file. The bundle arrays are memory mapped, so no
+    decompressing or copying is done and processes loading the same bundle
+    share one copy of it through the page cache. A bundle made with
+    `npz_to_bundle` stores the `mesh_cache_key` of its .npz file in its
+    header. If there is also a .npz file and its key does not match, the
+    bundle is stale or the .npz file was saved again after the bundle, so
+    the file that was changed last is loaded and a warning is given. The
+    cache key of the loaded file is used for the mesh cache.
+
     References
     ----------
     .. [*] Keenan Crane, Clarisse Weischedel, and Max Wardetzky. 2013.
@@ -228,8 +723,140 @@ def load_mesh(mesh_name: str,
 
     See Also
     --------
+    build_uv_tree : Makes a KD Tree of the UV map for nearest UV searches.
+    build_uv_vertex_map :
+        Makes array maps between UV row numbers and vertex row numbers.
     get_mesh_data :
         Saves out the mesh data from an obj file.
+    load_mesh_cache : Loads the prepared mesh structures from a mesh cache.
+    '''
+    pass
+
+
+def load_mesh_bundle(bundle_file: str) -> Dict[str, np.ndarray]:
+    '''
+    Memory maps the arrays of a mesh bundle.
+
+    Parameters
+    ----------
+    bundle_file : str
+        The path to the bundle file saved by `save_mesh_bundle`.
+
+    Returns
+    -------
+    mesh_arrays : Dict[str, np.ndarray]
+        Read only memory mapped arrays keyed by the names they were saved
+        with.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a mesh bundle or was made with a different
+        `MESH_BUNDLE_VERSION`
+
+    See Also
+    --------
+    save_mesh_bundle : Saves mesh arrays as an uncompressed mesh bundle.
+    '''
+    pass
+
+
+def load_mesh_cache(cache_directory: str, cache_key: str
+                    ) -> Optional[Tuple[cKDTree, np.ndarray, np.ndarray,
+                                        np.ndarray]]:
+    '''
+    Loads the prepared mesh structures from a mesh cache.
+
+    Parameters
+    ----------
+    cache_directory : str
+        The path to the folder the mesh cache is kept in.
+    cache_key : str
+        The key of the mesh data made by `mesh_cache_key`.
+
+    Returns
+    -------
+    uv_tree : cKDTree
+        KD Tree of the UV points of the mesh.
+    uv_to_vertex : np.ndarray
+        A 1D integer array of the vertex number of each UV row.
+    vertex_uv_offsets : np.ndarray
+        A 1D integer array of where the UV row numbers of each vertex start
+        in `vertex_uvs`.
+    vertex_uvs : np.ndarray
+        A 1D integer array of the UV row numbers of every vertex, grouped by
+        vertex.
+
+    Returns None if there is no cache for `cache_key` or if the cache was made
+    with a different `MESH_CACHE_VERSION`.
+
+    See Also
+    --------
+    mesh_cache_key : Makes the cache key of a saved mesh data file or bundle.
+    save_mesh_cache : Saves the prepared mesh structures to a mesh cache.
+
+    Notes
+    -----
+    The integer arrays are memory mapped read only, so loading them does not
+    copy them into memory until they are used.
+    '''
+    pass
+
+
+def mesh_cache_key(mesh_file: str, resolution: int = 0) -> str:
+    '''
+    Makes the cache key of a saved mesh data file or bundle.
+
+    Parameters
+    ----------
+    mesh_file : str
+        The path to the .npz file saved from `get_mesh_data` or to a mesh
+        bundle saved by `save_mesh_bundle`.
+    resolution : int, default: 0
+        The level of the mesh the cache is for. For levels above 0, the level
+        number is added to the end of the key, such as ``<hash>_1``.
+
+    Returns
+    -------
+    cache_key : str
+        The SHA-256 hash of the mesh data as a hex string.
+
+    Notes
+    -----
+    For a .npz file the key is the hash of the contents of the file. For a
+    bundle it is the `content_hash` stored in the bundle header, which is
+    the hash of the array data written after the header, so only the header
+    is read. In both cases the key depends only on the mesh data, so a cache
+    is no longer used once the mesh data is saved again with any change.
+    '''
+    pass
+
+
+def npz_to_bundle(npz_file: str, bundle_file: Optional[str] = None) -> str:
+    '''
+    Converts a saved .npz mesh data file to a mesh bundle.
+
+    Parameters
+    ----------
+    npz_file : str
+        The path to the .npz file saved from `get_mesh_data`.
+    bundle_file : str, optional
+        The path to save the bundle to. If not given, the bundle is saved next
+        to the .npz file with the `.bundle` extension.
+
+    Returns
+    -------
+    bundle_file : str
+        The path the bundle was saved to.
+
+    See Also
+    --------
+    save_mesh_bundle : Saves mesh arrays as an uncompressed mesh bundle.
+
+    Notes
+    -----
+    The `mesh_cache_key` of the .npz file is saved as the `source_hash` of
+    the bundle so `load_mesh` can tell when the bundle is stale.
     '''
     pass
 
@@ -316,6 +943,182 @@ def obj_to_txt(model_directory: str, mesh_file: str) -> None:
     pass
 
 
+def pixels_to_uv_indicies(pixel_points: np.ndarray, uv_tree: cKDTree,
+                          image_x_size: int, image_y_size: int) -> np.ndarray:
+    '''
+    Finds the nearest UV to each of a set of location drawing pixels.
+
+    All of the pixels are scaled to UV space and searched for in the KD Tree
+    in a single query instead of one pixel at a time.
+
+    Parameters
+    ----------
+    pixel_points : np.ndarray
+        A Mx2 array of the x and y pixel values to look up. A Nx4 array of
+        starting and ending centroids can be given as a (2N)x2 array by
+        stacking the start and end columns.
+    uv_tree : cKDTree
+        KD Tree of the UV map made by `build_uv_tree`.
+    image_x_size : int
+        The x dimension of the location drawing image in pixels
+    image_y_size : int
+        The y dimension of the location drawing image in pixels
+
+    Returns
+    -------
+    uv_indicies : np.ndarray
+        A 1D integer array of the row number in the UV array of the closest UV
+        to each pixel, in the order of `pixel_points`.
+
+    Raises
+    ------
+    ValueError
+        If `pixel_points` is not a Mx2 array
+
+    See Also
+    --------
+    build_uv_tree : Makes a KD Tree of the UV map for nearest UV searches.
+
+    Notes
+    -----
+    Pixel values start from the top left corner of the location drawing while
+    UV values start from the bottom left corner, so the y pixel values are
+    flipped when they are scaled to the 0 to 1 UV range.
+    '''
+    pass
+
+
+def read_obj(model_directory: str, obj_file: str
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                        np.ndarray]:
+    '''
+    Reads the mesh and UV data from an OBJ file in one pass.
+
+    Parameters
+    ----------
+    model_directory : str
+        The relative path to the folder that contains the UV mapped mesh files
+        in obj format.
+    obj_file : str
+        The name of the obj mesh file.
+
+    Returns
+    -------
+    verticies : np.ndarray
+        A Vx3 float64 array of each vertex value.
+    faces : np.ndarray
+        A Fx3 int64 array of the vertex row numbers of each face.
+    face_uvs : np.ndarray
+        A Fx3 int64 array of the UV row numbers of each face corner.
+    uv_array : np.ndarray
+        A Ux2 float64 array of the x and y positions of each UV point.
+    lookup_table : np.ndarray
+        A Nx2 int64 array of each unique pair of UV row number and vertex row
+        number used by the faces. This holds the same links as the lookup
+        table from `txt_to_dataframe`.
+
+    Raises
+    ------
+    ValueError
+        If a face is not a triangle or does not have a UV index on every
+        corner
+
+    See Also
+    --------
+    get_mesh_data :
+        Saves out the mesh data from an obj file.
+    obj_to_txt :
+        Takes in an OBJ mesh file and converts it into a text file.
+
+    Notes
+    -----
+    The file is read into memory as bytes once. The lines are split by their
+    first token, and the `v`, `vt`, and `f` lines are each parsed in a single
+    call to numpy after the `/` separators of the face tokens are replaced by
+    spaces. Comments, material, grouping, and smoothing lines are skipped, so
+    files exported from blender do not need to be cleaned up first. The `vn`
+    lines are skipped as the normal data is not used.
+
+    All of the indicies returned are 0 based. The indicies in the OBJ file are
+    1 based and are shifted when read.
+    '''
+    pass
+
+
+def save_mesh_bundle(bundle_file: str,
+                     mesh_arrays: Dict[str, np.ndarray],
+                     source_hash: Optional[str] = None) -> None:
+    '''
+    Saves mesh arrays as an uncompressed mesh bundle.
+
+    Parameters
+    ----------
+    bundle_file : str
+        The path to save the bundle to.
+    mesh_arrays : Dict[str, np.ndarray]
+        The arrays to save keyed by name, such as `verticies`, `faces`,
+        `uv_array`, and `lookup_table`, the Nx2 array of UV row number and
+        vertex row number pairs from `read_obj`.
+    source_hash : str, optional
+        The `mesh_cache_key` of the .npz file the arrays were taken from.
+        Bundles saved straight from `get_mesh_data` have none.
+
+    See Also
+    --------
+    load_mesh_bundle : Memory maps the arrays of a mesh bundle.
+    npz_to_bundle : Converts a saved .npz mesh data file to a mesh bundle.
+
+    Notes
+    -----
+    A bundle is a single file that starts with the bytes ``D3DBNDL``, a
+    version byte, and the length of a JSON header. The header lists the name,
+    data type, shape, and byte offset of each array, the `source_hash`, and
+    the `content_hash`, the SHA-256 hash of the array data used as the
+    bundle's `mesh_cache_key`. The raw array data follows with each array
+    starting on a 4096 byte boundary, so every array can be memory mapped
+    with `np.memmap` without copying. The file is written to a temporary name
+    and renamed when done so no reader sees a partial bundle.
+    '''
+    pass
+
+
+def save_mesh_cache(cache_directory: str, cache_key: str, uv_tree: cKDTree,
+                    uv_to_vertex: np.ndarray, vertex_uv_offsets: np.ndarray,
+                    vertex_uvs: np.ndarray) -> None:
+    '''
+    Saves the prepared mesh structures to a mesh cache.
+
+    Parameters
+    ----------
+    cache_directory : str
+        The path to the folder the mesh cache is kept in. It is made if it
+        does not exist.
+    cache_key : str
+        The key of the mesh data made by `mesh_cache_key`.
+    uv_tree : cKDTree
+        KD Tree of the UV points of the mesh.
+    uv_to_vertex : np.ndarray
+        A 1D integer array of the vertex number of each UV row.
+    vertex_uv_offsets : np.ndarray
+        A 1D integer array of where the UV row numbers of each vertex start
+        in `vertex_uvs`.
+    vertex_uvs : np.ndarray
+        A 1D integer array of the UV row numbers of every vertex, grouped by
+        vertex.
+
+    See Also
+    --------
+    load_mesh_cache : Loads the prepared mesh structures from a mesh cache.
+
+    Notes
+    -----
+    Each cache is saved to a folder named by `MESH_CACHE_VERSION` and the
+    cache key. The files are written to a temporary folder first and then
+    renamed, so other processes never read a half written cache.
+    '''
+    pass
+
+
 def txt_to_dataframe(model_directory: str,
                      file_name: str) -> Tuple[pl.DataFrame, pl.DataFrame]:
     '''
@@ -414,3 +1217,89 @@ def txt_to_dataframe(model_directory: str,
     .. note:: There are 3 columns here because every face is a triangle.
     '''
     pass
+
+
+def update_mesh_bundle(bundle_file: str, model_directory: str, obj_file: str,
+                       cache_directory: Optional[str] = None,
+                       registry: Optional[MeshRegistry] = None,
+                       mesh_name: Optional[str] = None) -> Dict[str, Any]:
+    '''
+    Updates a mesh bundle from a changed OBJ file, redoing only what changed.
+
+    Reads the new OBJ file, compares it to the saved bundle with `diff_mesh`,
+    and rewrites only the parts of the bundle and mesh cache that depend on
+    what changed.
+
+    Parameters
+    ----------
+    bundle_file : str
+        The path to the mesh bundle to update.
+    model_directory : str
+        The relative path to the folder that contains the UV mapped mesh files
+        in obj format.
+    obj_file : str
+        The name of the changed obj mesh file.
+    cache_directory : str, optional
+        The folder of the mesh cache to update along with the bundle.
+    registry : MeshRegistry, optional
+        A registry that may hold the mesh loaded from the old bundle. If
+        given, every loaded level of `mesh_name` is evicted from it once the
+        updated bundle is written.
+    mesh_name : str, optional
+        The name of the mesh in `registry`, i.e. Male Left Arm, Male Right
+        Arm, Female Left Arm, Female Right Arm. Needed if `registry` is given.
+
+    Returns
+    -------
+    report : Dict[str, Any]
+        What was done, with the keys `geometry_changed`, `changed_islands`,
+        `changed_uvs`, `rebuilt`, and `reused`, where the last two are lists
+        of the names of the arrays and structures that were rebuilt and
+        reused. The arrays of each remade coarser level are listed in
+        `rebuilt`.
+
+    Raises
+    ------
+    ValueError
+        If `registry` is given without `mesh_name`
+
+    See Also
+    --------
+    decimate_mesh :
+        Makes a coarser copy of a mesh with its UV data kept matched.
+    diff_mesh : Finds what changed between saved mesh data and new mesh data.
+    mesh_cache_key : Makes the cache key of a saved mesh data file or bundle.
+    MeshRegistry.evict : Drops a loaded mesh
+    read_obj : Reads the mesh and UV data from an OBJ file in one pass.
+
+    Notes
+    -----
+    When only UVs changed, the rows of the UV array and lookup table of the
+    changed islands are patched and the verticies, faces, and face areas are
+    reused. The KD Tree of the UVs and both directions of the UV and vertex
+    map can not be patched in place, so they are remade, which takes well
+    under a second even on the high resolution arm meshes. When
+    `geometry_changed` is True, every array of the full mesh is made again
+    from the new OBJ file as `get_mesh_data` would.
+
+    The coarser levels can not be patched, as `decimate_mesh` picks which
+    edges to collapse from the UV seams and drawing borders. When anything
+    changed, every coarser level is made again from the updated full mesh
+    with `decimate_mesh` and its saved fraction from `resolution_levels`,
+    replacing all of its arrays, such as `verticies_1`, `uv_array_1`, and
+    `lookup_table_1`. A level is never left with the data of the old mesh.
+
+    The solvers are not saved in the bundle or the mesh cache, so there is
+    nothing of them to update here. They are made from the bundle verticies
+    and faces by `load_mesh`, so a mesh loaded before the update keeps its
+    old solvers and UV data until it is loaded again. Evicting it from
+    `registry` makes the next `MeshRegistry.get` load the updated bundle.
+
+    The updated bundle is written to a temporary file and renamed over the old
+    one. Its new `content_hash` is the `mesh_cache_key` of the bundle, so the
+    mesh cache of each level is saved under ``mesh_cache_key(bundle_file,
+    level)`` and the caches of the old bundle are no longer used. The
+    `source_hash` is kept, so `load_mesh` still loads the updated bundle over
+    the .npz file it was made from.
+    '''
+    pass
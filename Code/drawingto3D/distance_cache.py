@@ -0,0 +1,171 @@
+'''
+Keeps recently solved distance fields so they can be reused.
+
+Each heat method solve gives the distance from a set of source verticies to
+every vertex on the mesh. When the same sources come up again, such as
+fingertips or the center of the palm, the stored field is indexed instead of
+solving again.
+
+Classes
+-------
+DistanceFieldCache : Least recently used store of distance fields.
+
+Notes
+-----
+Storing fields as float16 or float32 lowers the memory used per field. float16
+keeps about 3 significant digits, which is enough for display but should not
+be used for reported distances.
+'''
+from __future__ import annotations
+import numpy as np
+from typing import Dict, Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import potpourri3d as pp3d
+
+
+class DistanceFieldCache():
+    '''
+    Least recently used store of distance fields.
+
+    Fields are keyed by the mesh name, the mesh level, and the set of source
+    verticies. Vertex numbers of different levels of a mesh do not match, so
+    a field is only found for the level it was solved on. The order the
+    sources are given in does not change the key.
+
+    Attributes
+    ----------
+    max_bytes : int
+        The most bytes of distance fields to keep
+    dtype : np.dtype
+        The data type the fields are stored as
+    current_bytes : int
+        The bytes used by the stored fields
+    hits : int
+        The number of lookups that found a stored field
+    misses : int
+        The number of lookups that did not find a stored field
+    evictions : int
+        The number of fields dropped to stay within `max_bytes`
+
+    Methods
+    -------
+    __init__(max_bytes, dtype)
+        Sets up an empty cache
+    clear()
+        Drops every stored field and resets the statistics
+    get(mesh_name, source_verticies, resolution)
+        Returns a stored field if there is one
+    get_or_compute(mesh_name, source_verticies, distance_solver, resolution)
+        Returns a stored field or solves and stores it
+    put(mesh_name, source_verticies, distance_field, resolution)
+        Stores a field
+    stats()
+        Returns the hit, miss, and size statistics
+    '''
+    def __init__(self, max_bytes: int = 256 * 2**20,
+                 dtype: np.dtype = np.float64) -> None:
+        '''
+        Sets up an empty cache
+
+        Parameters
+        ----------
+        max_bytes : int, default: 256 MiB
+            The most bytes of distance fields to keep
+        dtype : np.dtype, default: np.float64
+            The data type to store fields as. Must be float16, float32, or
+            float64.
+
+        Raises
+        ------
+        ValueError
+            If `max_bytes` is not positive or `dtype` is not a float type
+        '''
+        pass
+
+    def clear(self) -> None:
+        '''
+        Drops every stored field and resets the statistics
+        '''
+        pass
+
+    def get(self, mesh_name: str, source_verticies: Iterable[int],
+            resolution: int = 0) -> Optional[np.ndarray]:
+        '''
+        Returns a stored field if there is one
+
+        Parameters
+        ----------
+        mesh_name : str
+            The name of the mesh the field was solved on
+        source_verticies : Iterable[int]
+            The vertex numbers the field was solved from
+        resolution : int, default: 0
+            The level of the mesh the field was solved on
+
+        Returns
+        -------
+        distance_field : np.ndarray or None
+            A read only array of the distance to every vertex, or None if the
+            field is not stored. A found field becomes the most recently used.
+        '''
+        pass
+
+    def get_or_compute(self, mesh_name: str, source_verticies: Iterable[int],
+                       distance_solver: pp3d.MeshHeatMethodDistanceSolver,
+                       resolution: int = 0) -> np.ndarray:
+        '''
+        Returns a stored field or solves and stores it
+
+        Parameters
+        ----------
+        mesh_name : str
+            The name of the mesh `distance_solver` was made for
+        source_verticies : Iterable[int]
+            The vertex numbers to solve the field from
+        distance_solver : pp3d.MeshHeatMethodDistanceSolver
+            Heat method solver for the mesh
+        resolution : int, default: 0
+            The level of the mesh `distance_solver` was made for
+
+        Returns
+        -------
+        distance_field : np.ndarray
+            A read only array of the distance to every vertex
+        '''
+        pass
+
+    def put(self, mesh_name: str, source_verticies: Iterable[int],
+            distance_field: np.ndarray, resolution: int = 0) -> None:
+        '''
+        Stores a field
+
+        Parameters
+        ----------
+        mesh_name : str
+            The name of the mesh the field was solved on
+        source_verticies : Iterable[int]
+            The vertex numbers the field was solved from
+        distance_field : np.ndarray
+            The distance to every vertex. It is copied as `dtype`.
+        resolution : int, default: 0
+            The level of the mesh the field was solved on
+
+        Notes
+        -----
+        The least recently used fields are dropped until the new field fits
+        in `max_bytes`. A field larger than `max_bytes` is not stored.
+        '''
+        pass
+
+    def stats(self) -> Dict[str, float]:
+        '''
+        Returns the hit, miss, and size statistics
+
+        Returns
+        -------
+        statistics : Dict[str, float]
+            The `hits`, `misses`, `evictions`, `hit_rate`, `fields`, and
+            `current_bytes` of the cache
+        '''
+        pass
@@ -0,0 +1,146 @@
+'''
+Finds exact polyhedral geodesic distances with window propagation.
+
+potpourri3d only gives the approximate heat method distance and the locally
+shortest edge flip path. This module gives the exact shortest distance across
+the faces of the mesh, treating each face as a flat triangle, for uses where
+the distance must not depend on an approximation.
+
+Classes
+-------
+ExactGeodesicSolver : Window propagation solver of exact geodesic distances.
+
+Notes
+-----
+The solver follows the MMP algorithm [*]_ as made practical by Surazhsky et
+al. [*]_. Each edge holds a list of intervals, called windows, over which the
+shortest path from the source unfolds to a straight line through the faces.
+Windows are taken from a priority queue in order of their smallest distance
+and pushed across the next face, where they are trimmed against the windows
+already on the far edges. A window is only kept where it gives a shorter
+distance than every other window on the same part of the edge, so once the
+queue is empty, the distance at any point is the smallest over the windows
+of its edge.
+
+The work grows faster than linearly with the number of verticies, so a
+solve costs much more than a heat method solve on the high resolution arm
+meshes. Use it for the pairs that need an exact answer or to check the other
+methods, not for every row of a large data set.
+
+References
+----------
+.. [*] Joseph S. B. Mitchell, David M. Mount, and Christos H. Papadimitriou.
+   1987. The discrete geodesic problem. SIAM J. Comput. 16, 4 (August
+   1987), 647-668. https://doi.org/10.1137/0216045
+.. [*] Vitaly Surazhsky, Tatiana Surazhsky, Danil Kirsanov, Steven J.
+   Gortler, and Hugues Hoppe. 2005. Fast exact and approximate geodesics on
+   meshes. ACM Trans. Graph. 24, 3 (July 2005), 553-560.
+   https://doi.org/10.1145/1073204.1073228
+'''
+from __future__ import annotations
+import numpy as np
+from typing import Iterable, Optional
+
+
+class ExactGeodesicSolver():
+    '''
+    Window propagation solver of exact geodesic distances.
+
+    Attributes
+    ----------
+    verticies : np.ndarray
+        A Vx3 float64 array of each vertex value
+    faces : np.ndarray
+        A Fx3 int64 array of the vertex row numbers of each face
+    edge_faces : np.ndarray
+        A Ex2 array of the faces on each side of each edge, with -1 for edges
+        on the border of the mesh
+
+    Methods
+    -------
+    __init__(verticies, faces)
+        Prepares the edge and face tables of a mesh
+    compute_distance(source_vertex, end_verticies)
+        Finds the exact distance from one vertex
+    compute_distance_multisource(source_verticies, end_verticies)
+        Finds the exact distance from the nearest of a set of verticies
+    '''
+    def __init__(self, verticies: np.ndarray, faces: np.ndarray) -> None:
+        '''
+        Prepares the edge and face tables of a mesh
+
+        Parameters
+        ----------
+        verticies : np.ndarray
+            A Vx3 array of each vertex value
+        faces : np.ndarray
+            A Fx3 array of the vertex row numbers of each face
+
+        Raises
+        ------
+        ValueError
+            If an edge is shared by more than two faces, as the windows can
+            not be unfolded across it
+        '''
+        pass
+
+    def compute_distance(self, source_vertex: int,
+                         end_verticies: Optional[np.ndarray] = None
+                         ) -> np.ndarray:
+        '''
+        Finds the exact distance from one vertex
+
+        Parameters
+        ----------
+        source_vertex : int
+            The vertex number to find distances from
+        end_verticies : np.ndarray, optional
+            The vertex numbers the distance is needed for. If given, the
+            propagation stops once no window in the queue can lower the
+            distance of any of them, and the distances of other verticies are
+            left as upper bounds.
+
+        Returns
+        -------
+        distance_field : np.ndarray
+            A 1D float64 array of the distance to every vertex, in the same
+            layout as the field from the heat method solver
+
+        Raises
+        ------
+        IndexError
+            If `source_vertex` is not a vertex of the mesh
+        '''
+        pass
+
+    def compute_distance_multisource(self, source_verticies: Iterable[int],
+                                     end_verticies: Optional[np.ndarray] = None
+                                     ) -> np.ndarray:
+        '''
+        Finds the exact distance from the nearest of a set of verticies
+
+        Parameters
+        ----------
+        source_verticies : Iterable[int]
+            The vertex numbers to find distances from
+        end_verticies : np.ndarray, optional
+            The vertex numbers the distance is needed for, as in
+            `compute_distance`
+
+        Returns
+        -------
+        distance_field : np.ndarray
+            A 1D float64 array of the distance from the nearest source to
+            every vertex
+
+        See Also
+        --------
+        compute_distance :
+            Finds the exact distance from one vertex
+
+        Notes
+        -----
+        The windows of every source are put in the same queue, so this costs
+        about the same as one solve.
+        '''
+        pass
@@ -1,5 +1,14 @@
 import numpy as np
-from typing import Dict
+from typing import Iterator, List, Optional, Tuple
+from drawingto3D.distance_cache import DistanceFieldCache
+from drawingto3D.landmark_index import LandmarkIndex
+from drawingto3D.mesh_registry import MeshRegistry
+from drawingto3D.path_store import PathStore
+
+DISTANCE_METHODS = ("heat", "edgeflip", "exact", "dijkstra")
+'''
+Tuple[str, ...] : The distance methods `GeodesicPath` can use.
+'''
 
 
 class GeodesicPath():
@@ -10,24 +19,56 @@ class GeodesicPath():
     through function calls and get out calculated distance and path information
     from the geodesic path found on the mesh.
 
+    The mesh loading, nearest UV searches, distance solves, and path solves
+    each record a timing span and count with `instrumentation` when it is
+    turned on.
+
     Attributes
     ----------
     drawing_name : str
         The name of the 2D location drawing template
     mesh_name : str
         The name of the mesh to find the geodesic distance and path on
+    distance_cache : DistanceFieldCache or None
+        The cache of distance fields checked before each heat method solve
+    resolution : int
+        The level of the mesh used, where 0 is the full mesh
+    coarse_to_fine : bool
+        Whether distances on a coarse level are refined on the full mesh. If
+        True, every mesh attribute is of the full mesh and only the distance
+        fields are solved on the `resolution` level.
+    distance_method : str
+        The method `calculate_distances` uses, one of `DISTANCE_METHODS`
     distance_solver : MeshHeatMethodDistanceSolver
         MeshHeatMethodDistanceSolver object for finding geodesic distances
         using the heat method
     path_solver : EdgeFlipGeodesicSolver
         EdgeFlipGeodesicSolver object for showing the geodesic path between two
         points using edge flips
+    exact_solver : ExactGeodesicSolver or None
+        Window propagation solver of exact distances, made from the saved
+        mesh verticies and faces when `distance_method` is exact
     uv_array : ndarray
         numpy array of all of the uv data values of a mesh
+    uv_to_vertex_map : ndarray
+        The vertex row number of each row of `uv_array`, returned by
+        `data_manager.load_mesh` with the rest of the mesh data
+    vertex_uv_offsets : ndarray
+        Where the UV row numbers of each vertex start in `vertex_uvs`
+    vertex_uvs : ndarray
+        The UV row numbers of every vertex grouped by vertex, used to find
+        every UV of a vertex on a seam of the UV map
+    uv_tree : cKDTree
+        KD Tree of `uv_array` returned by `data_manager.load_mesh`, or loaded
+        from the mesh cache, and used for every nearest UV search
     lookup_data: DataFrame
         Polars DataFrame of the data that make up the faces of the mesh. This
         is made by referencing vertex, uv, and normal vector index values from
         the rest of the mesh data.
+    face_uvs : ndarray
+        The UV row number of each face corner, for the surface functions
+    face_areas : ndarray
+        The area of each face, for the surface functions
     start_x_location : float or ndarray
         The x pixel value of the starting location drawing centroid
     start_y_location : float or ndarray
@@ -38,30 +79,60 @@ class GeodesicPath():
         The y pixel value of the starting location drawing centroid
     path_verticies : ndarray
         An array of the start and end vertex numbers for the location drawing
-        centriods
+        centriods, on the full mesh when `coarse_to_fine` is True and on the
+        `resolution` level otherwise
     found_distances : ndarray
         An array of all of the found geodesic distances
-    found_paths : Dict[str, ndarray]
-        A dictionary of each path found labeled by a path number
+    local_solvers : dict
+        The most recently used distance solvers of local regions in least to
+        most recently used order. Each is keyed by the center vertex and
+        radius of its region, and a pair reuses a region whose ball holds the
+        pair's own ball.
+    found_paths : PathStore
+        Every path found stored in one points buffer. Use
+        `found_paths.as_dict()` for a dictionary of each path labeled by a
+        path number.
+    path_times : ndarray
+        The time in seconds it took to find each path in `found_paths`
 
     Methods
     -------
-    __init__(sex, side)
+    __init__(sex, side, cache_directory, registry, distance_cache,
+             distance_method, resolution, coarse_to_fine)
         Sets up the names of the data to load in
     analyze_data(data)
         Loads in data and analyzes it
     analyzed_data_from_csv
         Loads in points to measure between from a file
+    calculate_approximate_distances(landmark_index, tolerance)
+        Finds distances from landmark bounds, solving only when needed
     calculate_distances()
         Find the distance between the starting and ending points
-    calculate_paths()
+    calculate_landmark_distances(landmark_verticies)
+        Finds the distances between every pair of a set of landmark verticies
+    calculate_local_distances(margin, max_regions)
+        Finds distances by solving on a small region around each pair
+    calculate_paths(workers, chunk_size)
         Finds the path between the start and end vertex
+    iter_csv_chunks(file_path, chunk_size)
+        Yields the distances between points in a csv file one chunk at a time
     load_data(data)
         Takes an Nx4 numpy array and converts it to start and end points
+    stream_data_from_csv(file_path, output_path, chunk_size)
+        Writes distances between points in a csv file one chunk at a time
     uv_to_vertex(centroid_x, centroid_y, image_x_size, image_y_size)
         Converts location drawing pixel value to 3D vertex location
+    uvs_to_verticies(pixel_points, image_x_size, image_y_size)
+        Converts many location drawing pixel values to 3D vertex locations
+    validate_local_distances(tolerance, sample_count, margin)
+        Compares local region distances to distances on the whole mesh
     '''
-    def __init__(self, sex: str = "male", side: str = "right") -> None:
+    def __init__(self, sex: str = "male", side: str = "right",
+                 cache_directory: Optional[str] = None,
+                 registry: Optional[MeshRegistry] = None,
+                 distance_cache: Optional[DistanceFieldCache] = None,
+                 distance_method: str = "heat", resolution: int = 0,
+                 coarse_to_fine: bool = False) -> None:
         '''
         Sets up the names of the data to load in
 
@@ -71,11 +142,45 @@ class GeodesicPath():
             The visual sex of the mesh (Male or Female)
         side : str, default: right
             The arm of the model (right or left)
+        cache_directory : str, optional
+            The folder to keep the prepared mesh data in between runs. Refer
+            to `data_manager.load_mesh` for what is cached. Not used when a
+            `registry` is given.
+        registry : MeshRegistry, optional
+            The registry to get the mesh from. Pass in
+            `mesh_registry.get_registry()` to share one copy of each mesh with
+            every other GeodesicPath in the process. If not given, the mesh is
+            loaded for this object only.
+        distance_cache : DistanceFieldCache, optional
+            A cache of distance fields to reuse between calls to
+            `calculate_distances`. It can be shared with other GeodesicPath
+            objects as fields are keyed by mesh name and level.
+        distance_method : str, default: heat
+            The method used to find distances. One of heat for the heat
+            method, edgeflip for the length of the shortened edge flip path,
+            exact for the exact polyhedral distance, or dijkstra for the
+            shortest path along the mesh edges.
+        resolution : int, default: 0
+            The level of the mesh to use. Level 0 is the full mesh and higher
+            levels are coarser. Refer to `data_manager.get_mesh_data`. The
+            level is passed on to the `registry` and `distance_cache` and to
+            the path worker processes.
+        coarse_to_fine : bool, default: False
+            If True, the full mesh is also loaded and distances found on the
+            coarse `resolution` level are refined near the endpoints on the
+            full mesh. The UV data, `uv_tree`, `path_verticies`, and the
+            path solver used by `calculate_paths` are then all of the full
+            mesh, and only the distance solver is of the coarse level. If
+            False, everything is of the `resolution` level.
 
         Raises
         ------
         KeyError
             If in unknown input is made
+        ValueError
+            If the `distance_method` is not one of `DISTANCE_METHODS`,
+            the `resolution` level is not saved in the mesh data, or
+            `coarse_to_fine` is True with a `resolution` of 0
         '''
         pass
 
@@ -99,6 +204,49 @@ class GeodesicPath():
         Loads in predetermined points to find geodesic distances between from
         a csv file. If there is a missing starting or ending point value, the
         code ommits that row of points from the loaded in data.
+
+        See Also
+        --------
+        iter_csv_chunks :
+            Yields the distances between points in a csv file one chunk at a
+            time
+        stream_data_from_csv :
+            Writes distances between points in a csv file one chunk at a time
+        '''
+        pass
+
+    def calculate_approximate_distances(self, landmark_index: LandmarkIndex,
+                                        tolerance: float) -> np.ndarray:
+        '''
+        Finds distances from landmark bounds, solving only when needed
+
+        Uses the triangle inequality bounds of a landmark index for each start
+        and end pair in `path_verticies`. Pairs whose bounds are within the
+        tolerance use the midpoint of the bounds and the rest are solved with
+        the heat method.
+
+        Parameters
+        ----------
+        landmark_index : LandmarkIndex
+            The landmark index built for this mesh
+        tolerance : float
+            The largest allowed gap between the bounds of an approximate
+            distance
+
+        Returns
+        -------
+        path_distances : np.ndarray
+            The found geodesic distances in order of the input data
+
+        Raises
+        ------
+        ValueError
+            If you have not given starting or ending points
+
+        See Also
+        --------
+        calculate_distances :
+            Find the distance between the starting and ending points
         '''
         pass
 
@@ -107,7 +255,10 @@ class GeodesicPath():
         Find the distance between the starting and ending points
 
         Finds the distances between the two points entered to all other points
-        and adds it to the visualization.
+        and adds it to the visualization. Rows that share a starting vertex are
+        grouped together so that only one distance field is solved for each
+        unique starting vertex. The distances to every ending vertex in that
+        group are then indexed out of the same field at once.
 
         Returns
         -------
@@ -125,26 +276,186 @@ class GeodesicPath():
         shortest distance between any two points that goes across the mesh.
         This is done using the Heat Method [*]_.
 
+        Each solve of the heat method covers the whole mesh, so the run time
+        scales with the number of unique starting verticies in
+        `path_verticies` instead of the number of rows. Data where many rows
+        start from the same location drawing centroid will see the largest
+        speed up.
+
+        When a `distance_cache` is given, the field of each unique starting
+        vertex is taken from the cache if it is there, and only the missing
+        fields are solved and added to it.
+
+        The `distance_method` changes how the distances are found:
+
+        heat
+            The Heat Method as described above. Fast, but approximate and
+            dependent on the quality of the mesh triangles.
+        edgeflip
+            The length of the edge flip path [*]_ between each pair. The edge
+            flips shorten the path until it is a locally shortest geodesic,
+            which is not always the globally shortest one. It starts from the
+            path along the mesh edges, so on most arm meshes it is the
+            shortest, but it can settle on a longer path around the other
+            side of the arm. It matches the length reported with
+            `calculate_paths` and costs about one path per row.
+        exact
+            The exact shortest distance across the faces of the mesh, found
+            by window propagation [*]_ with
+            `exact_geodesic.ExactGeodesicSolver`. One solve is done per
+            unique starting vertex and stops once all of its ending verticies
+            are settled. This is the method to use when the distance must not
+            depend on an approximation, but it is far slower than heat.
+        dijkstra
+            The shortest path along the edges of the mesh, found with
+            Dijkstra's algorithm on the graph from
+            `data_manager.build_edge_graph`. The search of each unique
+            starting vertex stops once all of its ending verticies are
+            settled. Paths along edges zig zag, so this is always longer than
+            the geodesic distance, by a few percent on a regular mesh.
+
+        With `coarse_to_fine`, each distance field is solved on the coarse
+        level. The full mesh start and end verticies of `path_verticies` are
+        matched to their nearest coarse verticies by position, and the coarse
+        distance between them is corrected by solving on full resolution
+        regions around each endpoint, in the same way as
+        `calculate_local_distances`. The returned distances are in the order
+        of `path_verticies` as usual.
+
         References
         ----------
         .. [*] Keenan Crane, Clarisse Weischedel, and Max Wardetzky. 2013.
            Geodesics in heat: A new approach to computing distance based on
            heat flow. ACM Trans. Graph. 32, 5, Article 152 (September 2013),
            11 pages https://doi.org/10.1145/2516971.2516977
+        .. [*] Nicholas Sharp and Keenan Crane. 2020. You can find
+           geodesic paths in triangle meshes by just flipping edges. ACM
+           Trans. Graph. 39, 6, Article 249 (December 2020), 15 pages.
+           https://doi.org/10.1145/3414685.3417839
+        .. [*] Vitaly Surazhsky, Tatiana Surazhsky, Danil Kirsanov, Steven J.
+           Gortler, and Hugues Hoppe. 2005. Fast exact and approximate
+           geodesics on meshes. ACM Trans. Graph. 24, 3 (July 2005),
+           553-560. https://doi.org/10.1145/1073204.1073228
+        '''
+        pass
+
+    def calculate_landmark_distances(self, landmark_verticies: np.ndarray
+                                     ) -> np.ndarray:
+        '''
+        Finds the distances between every pair of a set of landmark verticies
+
+        One distance field is solved from each landmark vertex and the
+        distances to all of the other landmarks are taken from that field.
+
+        Parameters
+        ----------
+        landmark_verticies : np.ndarray
+            A 1D array of the vertex numbers of the landmarks
+
+        Returns
+        -------
+        landmark_distances : np.ndarray
+            A KxK array of the geodesic distances between the K landmarks. Row
+            i holds the distances from landmark i to every landmark.
+
+        Raises
+        ------
+        ValueError
+            If no landmark verticies are given
+
+        See Also
+        --------
+        calculate_distances :
+            Find the distance between the starting and ending points
+
+        Notes
+        -----
+        The heat method is not symmetric, so the distance from landmark i to
+        landmark j can differ slightly from the distance from j to i. The
+        returned array is not symmetrized.
         '''
         pass
 
-    def calculate_paths(self) -> Dict[str, np.ndarray]:
+    def calculate_local_distances(self, margin: float = 0.5,
+                                  max_regions: int = 64) -> np.ndarray:
+        '''
+        Finds distances by solving on a small region around each pair
+
+        For each start and end pair in `path_verticies`, a submesh is cut out
+        around the pair and the heat method is solved on it instead of on the
+        whole mesh.
+
+        Parameters
+        ----------
+        margin : float, default: 0.5
+            The extra radius of each region as a fraction of the straight
+            line distance between the start and end vertex
+        max_regions : int, default: 64
+            The most local region solvers to keep in `local_solvers`
+
+        Returns
+        -------
+        path_distances : np.ndarray
+            The found geodesic distances in order of the input data
+
+        Raises
+        ------
+        ValueError
+            If you have not given starting or ending points
+
+        See Also
+        --------
+        calculate_distances :
+            Find the distance between the starting and ending points
+        data_manager.extract_submesh :
+            Cuts out the part of a mesh within a distance of a set of
+            verticies.
+        validate_local_distances :
+            Compares local region distances to distances on the whole mesh
+
+        Notes
+        -----
+        Each region starts as a ball of radius ``(1 + margin) * d / 2`` around
+        the midpoint of the pair, where d is the straight line distance
+        between them. A path that leaves the region must cross its border, so
+        the local distance is kept only when it is shorter than the distance
+        from the start vertex to every border vertex of the region. If it is
+        not, the radius is doubled and the region is solved again, falling
+        back to the whole mesh once the region covers it.
+
+        Making the operators of the heat method is most of the cost of a small
+        solve, so the solver of each region is kept in `local_solvers` under
+        the center vertex and radius of the region. Before a new region is
+        cut out, the stored regions are checked from most to least recently
+        used, and the first one whose ball holds the ball of the pair is
+        reused. That is when the distance between the two centers plus the
+        radius of the pair is no more than the radius of the stored region.
+        Once there are `max_regions` solvers, the least recently used one is
+        dropped.
+        '''
+        pass
+
+    def calculate_paths(self, workers: int = 1,
+                        chunk_size: int = 64) -> PathStore:
         '''
         Finds the path between the start and end vertex
 
         The path is found using edge flips until the start vertex connects to
         the end vertex
 
+        Parameters
+        ----------
+        workers : int, default: 1
+            The number of processes to find paths with. With 1 worker, the
+            paths are found in this process.
+        chunk_size : int, default: 64
+            The number of start and end pairs sent to a worker process at once
+
         Returns
         -------
-        data_dict : Dict(str, np.ndarray)/
-            The found paths between the input data
+        found_paths : PathStore
+            The found paths between the input data in the order of the input
+            data
 
         Raises
         ------
@@ -157,6 +468,14 @@ class GeodesicPath():
         the path on the mesh [*]_. Note that this path may not be the
         shortest path, just a demonstration.
 
+        Each path is found independently of the others, so with more than one
+        worker, the rows of `path_verticies` are split into chunks and sent to
+        a process pool. Every worker process makes its own path solver once
+        from the mesh data of the same `resolution` level when it starts,
+        using the mesh cache if one was given. The paths are returned in the
+        order of the input data and the time taken for each path is saved to
+        `path_times`.
+
         References
         ----------
         .. [*] Nicholas Sharp and Keenan Crane. 2020. You can find
@@ -166,11 +485,61 @@ class GeodesicPath():
         '''
         pass
 
+    def iter_csv_chunks(self, file_path: str, chunk_size: int = 100000
+                        ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        '''
+        Yields the distances between points in a csv file one chunk at a time
+
+        Reads the csv file in chunks of rows. Each chunk has the rows with a
+        missing starting or ending point value removed, is converted to
+        verticies, and has its distances found before it is yielded. The next
+        chunk is only read once the caller asks for it.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the csv file of start x, start y, end x, and end y
+            pixel values. The file must start with a header row.
+        chunk_size : int, default: 100000
+            The number of rows of the input file to read at once
+
+        Yields
+        ------
+        chunk_data : np.ndarray
+            A Mx4 array of the start x, start y, end x, and end y pixel values
+            of the rows kept from the chunk
+        chunk_distances : np.ndarray
+            The found geodesic distances of the kept rows in the same order
+
+        Raises
+        ------
+        ValueError
+            If the csv file does not have four columns
+
+        See Also
+        --------
+        stream_data_from_csv :
+            Writes distances between points in a csv file one chunk at a time
+
+        Notes
+        -----
+        Only one chunk is held in memory at a time, so the peak memory use
+        depends on `chunk_size` and not on the size of the file. Nothing is
+        written to disk. The `start_x_location`, `path_verticies`,
+        `found_distances` and similar attributes hold the values of the last
+        chunk yielded.
+
+        The file is read with the batched csv reader from polars.
+        '''
+        pass
+
     def load_data(self, data: np.ndarray) -> None:
         '''
         Takes an Nx4 numpy array and converts it to start and end points
 
-        These points are used for finding geodesic distances and paths
+        These points are used for finding geodesic distances and paths. The
+        start and end points of every row are converted to verticies together
+        with `uvs_to_verticies`.
 
         Parameters
         ----------
@@ -184,6 +553,55 @@ class GeodesicPath():
         '''
         pass
 
+    def stream_data_from_csv(self, file_path: str, output_path: str,
+                             chunk_size: int = 100000) -> int:
+        '''
+        Writes distances between points in a csv file one chunk at a time
+
+        Runs through every chunk from `iter_csv_chunks` and appends each to
+        the output file as soon as its distances are found.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the csv file of start x, start y, end x, and end y
+            pixel values. The file must start with a header row.
+        output_path : str
+            The path to the csv file to write the results to. The file is
+            overwritten if it exists.
+        chunk_size : int, default: 100000
+            The number of rows of the input file to read at once
+
+        Returns
+        -------
+        row_count : int
+            The number of rows written to the output file
+
+        Raises
+        ------
+        ValueError
+            If the csv file does not have four columns
+
+        See Also
+        --------
+        analyze_data_from_csv :
+            Loads in points to measure between from a file
+        iter_csv_chunks :
+            Yields the distances between points in a csv file one chunk at a
+            time
+
+        Notes
+        -----
+        The whole input is processed before this returns. The output file has
+        the columns start x, start y, end x, end y, and distance. Rows are
+        written as each chunk finishes, so earlier rows can be read while
+        later chunks are still running, but the file is only complete once
+        this call returns. If it raises, the file holds the chunks finished
+        before the error. Peak memory use depends on `chunk_size` and not on
+        the size of the file.
+        '''
+        pass
+
     def uv_to_vertex(self, centroid_x: float, centroid_y: float,
                      image_x_size: int, image_y_size: int) -> int:
         '''
@@ -191,6 +609,7 @@ class GeodesicPath():
 
         Takes the location drawing's centroid pixel location and converts it
         to a 3D vertex on the mesh by finding the closest UV value to the pixel
+        and indexing `uv_to_vertex_map` with its row number
 
         Parameters
         ----------
@@ -207,9 +626,124 @@ class GeodesicPath():
         -------
         nearest_vertex_id : int
             The row number of the closest vertex to the 2D centroid
+
+        See Also
+        --------
+        uvs_to_verticies :
+            Converts many location drawing pixel values to 3D vertex locations
+        '''
+        pass
+
+    def uvs_to_verticies(self, pixel_points: np.ndarray, image_x_size: int,
+                         image_y_size: int) -> np.ndarray:
+        '''
+        Converts many location drawing pixel values to 3D vertex locations
+
+        Finds the closest UV value to every pixel in one query of `uv_tree`
+        and converts those UVs to verticies on the mesh by indexing
+        `uv_to_vertex_map` with them.
+
+        Parameters
+        ----------
+        pixel_points : np.ndarray
+            A Mx2 array of x and y pixel values or a Nx4 array of start x,
+            start y, end x, and end y centroid pixel values
+        image_x_size : int
+            The x dimension of the location drawing image in pixels
+        image_y_size : int
+            The y dimension of the location drawing image in pixels
+
+        Returns
+        -------
+        nearest_vertex_ids : np.ndarray
+            The row numbers of the closest verticies to each pixel. This is a
+            1D array of length M for Mx2 input and a Nx2 array of start and
+            end verticies for Nx4 input.
+
+        Raises
+        ------
+        ValueError
+            If `pixel_points` does not have 2 or 4 columns
+
+        See Also
+        --------
+        uv_to_vertex :
+            Converts location drawing pixel value to 3D vertex location
         '''
         pass
 
+    def validate_local_distances(self, tolerance: float = 0.01,
+                                 sample_count: int = 100,
+                                 margin: float = 0.5) -> np.ndarray:
+        '''
+        Compares local region distances to distances on the whole mesh
+
+        Parameters
+        ----------
+        tolerance : float, default: 0.01
+            The largest allowed relative difference between the two distances
+        sample_count : int, default: 100
+            The number of rows of `path_verticies` to compare. The rows are
+            picked at random. If there are fewer rows, all are compared.
+        margin : float, default: 0.5
+            The margin passed to `calculate_local_distances`
+
+        Returns
+        -------
+        relative_errors : np.ndarray
+            The relative difference of each compared row
+
+        Raises
+        ------
+        ValueError
+            If any relative difference is over `tolerance`
+
+        See Also
+        --------
+        calculate_local_distances :
+            Finds distances by solving on a small region around each pair
+        '''
+        pass
+
+
+def _find_path_chunk(vertex_pairs: np.ndarray
+                     ) -> List[Tuple[np.ndarray, float]]:
+    '''
+    Finds the paths of a chunk of start and end verticies in a worker
+
+    Parameters
+    ----------
+    vertex_pairs : np.ndarray
+        A Nx2 array of start and end vertex numbers
+
+    Returns
+    -------
+    chunk_paths : List[Tuple[np.ndarray, float]]
+        The Nx3 path points and the time in seconds to find each path in the
+        order of `vertex_pairs`
+    '''
+    pass
+
+
+def _init_path_worker(mesh_name: str, data_path: str,
+                      cache_directory: Optional[str],
+                      resolution: int = 0) -> None:
+    '''
+    Makes the path solver of a worker process
+
+    Parameters
+    ----------
+    mesh_name : str
+        The name of the mesh to load
+    data_path : str
+        The relative path to the data folder containing the mesh data
+    cache_directory : str or None
+        The folder of the mesh cache
+    resolution : int, default: 0
+        The level of the mesh to make the path solver for
+    '''
+    pass
+
 
 if __name__ == "__main__":
     pass
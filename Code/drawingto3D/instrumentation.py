@@ -0,0 +1,274 @@
+'''
+Times the stages of the drawing to 3D pipeline when turned on.
+
+`GeodesicPath`, the surface functions, the mesh registry, and the distance
+field cache record timing spans and counters here. Nothing is recorded until
+`enable` is called, and while turned off each span costs one check of a
+module flag.
+
+Classes
+-------
+ProfileReport : Timings and counts recorded during a `profile` block.
+
+Methods
+-------
+count : Adds to a named counter.
+disable : Stops recording spans and counters.
+enable : Starts recording spans and counters.
+export_log : Writes the recorded metrics to a logger as one JSON record.
+export_prometheus : Writes the recorded metrics in the Prometheus text format.
+is_enabled : Returns whether spans and counters are being recorded.
+profile : Records the spans and counters of a block of code.
+reset : Clears the recorded spans and counters.
+span : Times a block of code under a stage name.
+
+Notes
+-----
+The stage names recorded are:
+
++---------------------------+---------------------------------------------+
+| Span                      | Stage                                       |
++===========================+=============================================+
+| `mesh.load`               | Loading mesh data and making the solvers    |
++---------------------------+---------------------------------------------+
+| `uv.nearest`              | Nearest UV searches of centroids or borders |
++---------------------------+---------------------------------------------+
+| `distance.solve`          | Each distance field solve                   |
++---------------------------+---------------------------------------------+
+| `path.solve`              | Each edge flip path                         |
++---------------------------+---------------------------------------------+
+| `surface.enclosed_uvs`    | Finding the UVs inside a drawing            |
++---------------------------+---------------------------------------------+
+| `surface.uv_to_vertex`    | Converting UVs to verticies                 |
++---------------------------+---------------------------------------------+
+| `surface.create`          | Building the pyvista surface                |
++---------------------------+---------------------------------------------+
+| `surface.area`            | Summing face areas                          |
++---------------------------+---------------------------------------------+
+
+and the counters are `mesh.cache.hit`, `mesh.cache.miss`,
+`mesh.registry.hit`, `mesh.registry.miss`, `distance.cache.hit`,
+`distance.cache.miss`, `distance.solves`, and `path.solves`.
+
+Spans and counters are kept per thread while recording and added together
+when they are read, so recording into the module totals from many threads
+does not need a lock. A `ProfileReport` can be shared by every thread that
+copied the context of its block, so each report has its own lock that is
+held while a span or count is added to it.
+
+Recording is on while `enable` has been called or while any `profile` block
+is running in any thread. The blocks are counted under a lock, so the first
+of two overlapping blocks to end does not turn recording off for the other.
+
+A `profile` block is tracked with a `contextvars.ContextVar`, so its report
+only holds what was recorded in its own context, even when other threads
+record at the same time. Work handed to other threads is only included when
+the thread runs in a copy of the context, as with `asyncio.to_thread` or
+`contextvars.copy_context().run`. Threads of a plain
+`concurrent.futures.ThreadPoolExecutor` start with an empty context and are
+left out. Spans recorded in worker processes, such as those of
+`GeodesicPath.calculate_paths` with more than one worker, are never
+collected, as each process records into its own memory.
+'''
+from __future__ import annotations
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+
+_active_reports: ContextVar[Optional[Tuple[ProfileReport, ...]]] = ContextVar(
+    "_active_reports", default=None)
+'''
+ContextVar[Tuple[ProfileReport, ...] or None] : The reports of the `profile`
+blocks the current context is in, from outermost to innermost.
+'''
+
+
+class ProfileReport():
+    '''
+    Timings and counts recorded during a `profile` block.
+
+    Attributes
+    ----------
+    span_counts : Dict[str, int]
+        The number of times each span was entered
+    span_totals : Dict[str, float]
+        The total seconds spent in each span
+    span_maximums : Dict[str, float]
+        The longest single time in seconds of each span
+    counters : Dict[str, int]
+        The value of each counter
+    lock : threading.Lock
+        Held while a span or count is added, as the report can be written
+        from every thread that copied the context of its block
+    wall_time : float
+        The seconds the `profile` block took
+
+    Methods
+    -------
+    hit_rate(name)
+        Returns the hit rate of a cache counter pair
+    summary()
+        Returns a text table of the report
+    '''
+    def hit_rate(self, name: str) -> float:
+        '''
+        Returns the hit rate of a cache counter pair
+
+        Parameters
+        ----------
+        name : str
+            The counter name without the `.hit` or `.miss` ending, such as
+            `distance.cache`
+
+        Returns
+        -------
+        hit_rate : float
+            The hits divided by the hits plus misses, or NaN if neither was
+            counted
+        '''
+        pass
+
+    def summary(self) -> str:
+        '''
+        Returns a text table of the report
+
+        Returns
+        -------
+        summary : str
+            A table of each span sorted by total time with its count, total,
+            mean, maximum, and share of the wall time, followed by the
+            counters
+        '''
+        pass
+
+
+def count(name: str, value: int = 1) -> None:
+    '''
+    Adds to a named counter.
+
+    Parameters
+    ----------
+    name : str
+        The name of the counter
+    value : int, default: 1
+        The amount to add
+    '''
+    pass
+
+
+def disable() -> None:
+    '''
+    Stops recording spans and counters.
+
+    The metrics recorded so far are kept until `reset` is called. Recording
+    keeps going while a `profile` block is running and stops when the last
+    one ends.
+    '''
+    pass
+
+
+def enable() -> None:
+    '''
+    Starts recording spans and counters.
+    '''
+    pass
+
+
+def export_log(logger: logging.Logger, level: int = logging.INFO) -> None:
+    '''
+    Writes the recorded metrics to a logger as one JSON record.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        The logger to write to
+    level : int, default: logging.INFO
+        The level to log the record at
+    '''
+    pass
+
+
+def export_prometheus(file_path: str) -> None:
+    '''
+    Writes the recorded metrics in the Prometheus text format.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to write to. The file is replaced with a rename so a scraper
+        never reads a partial file.
+
+    Notes
+    -----
+    Spans are written as `drawingto3d_span_seconds_total` and
+    `drawingto3d_span_count` with a `span` label, and counters as
+    `drawingto3d_events_total` with a `name` label. The file can be picked
+    up by the textfile collector of the Prometheus node exporter.
+    '''
+    pass
+
+
+def is_enabled() -> bool:
+    '''
+    Returns whether spans and counters are being recorded.
+
+    This is True while `enable` has been called or while any `profile` block
+    is running.
+    '''
+    pass
+
+
+@contextmanager
+def profile() -> Iterator[ProfileReport]:
+    '''
+    Records the spans and counters of a block of code.
+
+    Recording is on for the whole block. The block adds one to a count of
+    running blocks when it starts and takes one away when it ends, and
+    recording only stops once the count is back to 0 and `enable` was not
+    called, so overlapping blocks in other threads or tasks keep recording
+    until they end. The report only holds what was recorded inside the
+    block in the same context and is filled in when the block ends. Blocks
+    can be nested, and each span is added to the report of every block it is
+    in. Refer to the module Notes for which threads and processes are
+    included.
+
+    Yields
+    ------
+    report : ProfileReport
+        The report of the block
+
+    Examples
+    --------
+    >>> with profile() as report:
+    ...     geodesic_path.analyze_data(data)
+    >>> print(report.summary())
+    '''
+    pass
+
+
+def reset() -> None:
+    '''
+    Clears the recorded spans and counters.
+    '''
+    pass
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    '''
+    Times a block of code under a stage name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage
+
+    Notes
+    -----
+    When recording is turned off, this does nothing but check the flag.
+    Spans can be nested and each records its own full time. The time is also
+    added to the report of each `profile` block of the current context.
+    '''
+    pass
@@ -0,0 +1,225 @@
+'''
+Gives fast bounds on geodesic distances from precomputed landmark fields.
+
+The distance fields from K landmark verticies are solved once per mesh and
+saved as a KxV matrix. The distance between any two verticies is then bounded
+from the landmark distances with the triangle inequality, without solving.
+
+Classes
+-------
+LandmarkIndex : Memory mapped matrix of landmark distance fields.
+
+Methods
+-------
+farthest_point_sampling : Picks landmark verticies spread across the mesh.
+
+Notes
+-----
+For a start vertex s, an end vertex e, and any landmark l, the geodesic
+distance d(s, e) is at least ``|d(l, s) - d(l, e)|`` and at most
+``d(l, s) + d(l, e)``. The index takes the largest lower bound and smallest
+upper bound over all landmarks. The heat method distances are approximate, so
+the bounds are as well and can be broken by a small amount.
+'''
+from __future__ import annotations
+import numpy as np
+from typing import Optional, TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import potpourri3d as pp3d
+
+
+class LandmarkIndex():
+    '''
+    Memory mapped matrix of landmark distance fields.
+
+    Attributes
+    ----------
+    landmark_verticies : np.ndarray
+        The vertex numbers of the K landmarks
+    landmark_distances : np.ndarray
+        A KxV float32 memory mapped array of the distance from each landmark
+        to every vertex
+
+    Methods
+    -------
+    __init__(landmark_verticies, landmark_distances)
+        Wraps existing landmark data
+    bounds(start_verticies, end_verticies)
+        Finds the lower and upper bounds of the distances between verticies
+    build(distance_solver, vertex_count, landmark_count, file_path)
+        Solves the landmark fields of a mesh and saves them
+    load(file_path)
+        Memory maps a saved index
+    query(start_verticies, end_verticies, tolerance, distance_solver)
+        Finds distances from the bounds, solving only where they are loose
+    '''
+    def __init__(self, landmark_verticies: np.ndarray,
+                 landmark_distances: np.ndarray) -> None:
+        '''
+        Wraps existing landmark data
+
+        Parameters
+        ----------
+        landmark_verticies : np.ndarray
+            The vertex numbers of the K landmarks
+        landmark_distances : np.ndarray
+            A KxV array of the distance from each landmark to every vertex
+
+        Raises
+        ------
+        ValueError
+            If there is not one row of `landmark_distances` per landmark
+        '''
+        pass
+
+    def bounds(self, start_verticies: np.ndarray, end_verticies: np.ndarray
+               ) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Finds the lower and upper bounds of the distances between verticies
+
+        Parameters
+        ----------
+        start_verticies : np.ndarray
+            A 1D array of start vertex numbers
+        end_verticies : np.ndarray
+            A 1D array of end vertex numbers the same length as
+            `start_verticies`
+
+        Returns
+        -------
+        lower_bounds : np.ndarray
+            The largest lower bound of each distance over all landmarks
+        upper_bounds : np.ndarray
+            The smallest upper bound of each distance over all landmarks
+
+        Notes
+        -----
+        The columns of every start and end vertex are gathered at once, so
+        the cost is two KxN gathers and a reduction over K.
+        '''
+        pass
+
+    @classmethod
+    def build(cls, distance_solver: pp3d.MeshHeatMethodDistanceSolver,
+              vertex_count: int, landmark_count: int, file_path: str,
+              seed_vertex: int = 0) -> LandmarkIndex:
+        '''
+        Solves the landmark fields of a mesh and saves them
+
+        Parameters
+        ----------
+        distance_solver : pp3d.MeshHeatMethodDistanceSolver
+            Heat method solver for the mesh
+        vertex_count : int
+            The number of verticies in the mesh
+        landmark_count : int
+            The number of landmarks K to pick
+        file_path : str
+            The path to save the index to. The landmark verticies are saved
+            next to it in a .npy file of the same name with `_landmarks`
+            added.
+        seed_vertex : int, default: 0
+            The first landmark, which the farthest point sampling starts from
+
+        Returns
+        -------
+        landmark_index : LandmarkIndex
+            The index memory mapped from the saved file
+
+        See Also
+        --------
+        farthest_point_sampling :
+            Picks landmark verticies spread across the mesh.
+
+        Notes
+        -----
+        The fields solved while picking the landmarks are kept and written to
+        the matrix. The seed vertex is the first landmark, so building takes
+        K solves in total.
+        '''
+        pass
+
+    @classmethod
+    def load(cls, file_path: str) -> LandmarkIndex:
+        '''
+        Memory maps a saved index
+
+        Parameters
+        ----------
+        file_path : str
+            The path the index was saved to by `build`
+
+        Returns
+        -------
+        landmark_index : LandmarkIndex
+            The index with its distance matrix memory mapped read only
+        '''
+        pass
+
+    def query(self, start_verticies: np.ndarray, end_verticies: np.ndarray,
+              tolerance: float,
+              distance_solver: Optional[pp3d.MeshHeatMethodDistanceSolver]
+              = None) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Finds distances from the bounds, solving only where they are loose
+
+        Parameters
+        ----------
+        start_verticies : np.ndarray
+            A 1D array of start vertex numbers
+        end_verticies : np.ndarray
+            A 1D array of end vertex numbers
+        tolerance : float
+            The largest allowed gap between the upper and lower bound for the
+            bound midpoint to be used as the distance
+        distance_solver : pp3d.MeshHeatMethodDistanceSolver, optional
+            Heat method solver to find the exact distance of pairs whose
+            bounds gap is over `tolerance`. If not given, the midpoint is used
+            for every pair.
+
+        Returns
+        -------
+        distances : np.ndarray
+            The distance of each pair
+        solved : np.ndarray
+            A boolean array that is True for each pair that was solved
+        '''
+        pass
+
+
+def farthest_point_sampling(distance_solver: pp3d.MeshHeatMethodDistanceSolver,
+                            vertex_count: int, landmark_count: int,
+                            seed_vertex: int = 0
+                            ) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Picks landmark verticies spread across the mesh.
+
+    The seed vertex is the first landmark. Each new landmark is the vertex
+    farthest from all of the landmarks picked so far, so the field of every
+    landmark is solved once and no solve is thrown away.
+
+    Parameters
+    ----------
+    distance_solver : pp3d.MeshHeatMethodDistanceSolver
+        Heat method solver for the mesh
+    vertex_count : int
+        The number of verticies in the mesh
+    landmark_count : int
+        The number of landmarks to pick
+    seed_vertex : int, default: 0
+        The first landmark, which the first field is solved from
+
+    Returns
+    -------
+    landmark_verticies : np.ndarray
+        The vertex numbers of the landmarks, starting with `seed_vertex`
+    landmark_distances : np.ndarray
+        A KxV float32 array of the distance from each landmark to every vertex
+
+    Raises
+    ------
+    ValueError
+        If `landmark_count` is not between 1 and `vertex_count`
+    '''
+    pass
@@ -0,0 +1,242 @@
+'''
+Shares loaded meshes between every user in a process.
+
+Only four meshes exist, the male and female left and right arms, so each is
+loaded once and the same solvers and UV data are handed to every
+`GeodesicPath` that asks for it.
+
+Classes
+-------
+MeshRegistry : Thread safe store of loaded meshes.
+
+Methods
+-------
+get_registry : Returns the registry shared by the whole process.
+
+Notes
+-----
+The objects handed out by the registry are shared, so they should be treated
+as read only. Changing the UV array, lookup table, or UV KD Tree of one
+`GeodesicPath` changes it for all of them.
+'''
+from __future__ import annotations
+import numpy as np
+from typing import Iterable, List, Optional, TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import polars as pl
+    import potpourri3d as pp3d
+    from scipy.spatial import cKDTree
+
+
+class MeshRegistry():
+    '''
+    Thread safe store of loaded meshes.
+
+    Meshes are loaded with `data_manager.load_mesh` the first time they are
+    asked for and kept until they are evicted. Each level of a mesh is
+    stored under its own key of the mesh name and level, so the full and
+    coarse levels of the same mesh can be loaded at once.
+
+    Attributes
+    ----------
+    data_path : str
+        The relative path to the data folder containing the .npz files of the
+        mesh data
+    cache_directory : str or None
+        The folder passed on to `data_manager.load_mesh` for the mesh cache
+    memory_budget : int or None
+        The most bytes of mesh data to keep loaded. If None, meshes are never
+        evicted.
+    make_solvers : bool
+        Whether the distance and path solvers are made when a mesh is loaded
+    loaded_meshes : List[Tuple[str, int]]
+        The name and level of the loaded meshes from least to most recently
+        used
+    memory_usage : int
+        The estimated bytes used by the loaded meshes
+
+    Methods
+    -------
+    __init__(data_path, cache_directory, memory_budget, make_solvers)
+        Sets up an empty registry
+    clear()
+        Drops all of the loaded meshes
+    evict(mesh_name, resolution)
+        Drops a loaded mesh
+    get(mesh_name, resolution)
+        Returns the loaded mesh, loading it if needed
+    preload(mesh_names, resolutions)
+        Loads meshes ahead of their first use
+    '''
+    def __init__(self, data_path: str = "../Data",
+                 cache_directory: Optional[str] = None,
+                 memory_budget: Optional[int] = None,
+                 make_solvers: bool = True) -> None:
+        '''
+        Sets up an empty registry
+
+        Parameters
+        ----------
+        data_path : str, default: ../Data
+            The relative path to the data folder containing the .npz files of
+            the mesh data
+        cache_directory : str, optional
+            The folder to keep the mesh cache in
+        memory_budget : int, optional
+            The most bytes of mesh data to keep loaded
+        make_solvers : bool, default: True
+            If False, meshes are loaded without their distance and path
+            solvers, for processes that only turn pixels into verticies
+        '''
+        pass
+
+    @property
+    def loaded_meshes(self) -> List[Tuple[str, int]]:
+        '''
+        The name and level of the loaded meshes from least to most recently
+        used
+        '''
+        pass
+
+    @property
+    def memory_usage(self) -> int:
+        '''
+        The estimated bytes used by the loaded meshes
+
+        Notes
+        -----
+        The estimate adds up the bytes of the UV array, the lookup table, and
+        the mesh verticies and faces. The sparse operators held by the solvers
+        are estimated from the number of verticies when `make_solvers` is
+        True.
+        '''
+        pass
+
+    def clear(self) -> None:
+        '''
+        Drops all of the loaded meshes
+        '''
+        pass
+
+    def evict(self, mesh_name: str, resolution: Optional[int] = None
+              ) -> None:
+        '''
+        Drops a loaded mesh
+
+        Parameters
+        ----------
+        mesh_name : str
+            The name of the mesh, i.e. Male Left Arm, Male Right Arm, Female
+            Left Arm, Female Right Arm.
+        resolution : int, optional
+            The level of the mesh to drop. If not given, every loaded level of
+            the mesh is dropped.
+
+        Notes
+        -----
+        Any `GeodesicPath` still holding the mesh keeps working. The memory is
+        freed once the last of them is deleted.
+        '''
+        pass
+
+    def get(self, mesh_name: str, resolution: int = 0
+            ) -> Tuple[pp3d.MeshHeatMethodDistanceSolver,
+                       pp3d.EdgeFlipGeodesicSolver,
+                       np.ndarray, pl.DataFrame, cKDTree, np.ndarray,
+                       np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        '''
+        Returns the loaded mesh, loading it if needed
+
+        Parameters
+        ----------
+        mesh_name : str
+            The name of the mesh, i.e. Male Left Arm, Male Right Arm, Female
+            Left Arm, Female Right Arm.
+        resolution : int, default: 0
+            The level of the mesh to return, where 0 is the full mesh. Refer
+            to `data_manager.get_mesh_data`.
+
+        Returns
+        -------
+        distance_solver : pp3d.MeshHeatMethodDistanceSolver or None
+            Heat method solver for the mesh, or None if `make_solvers` is
+            False.
+        path_solver : pp3d.EdgeFlipGeodesicSolver or None
+            Geodesic path solver for the mesh, or None if `make_solvers` is
+            False.
+        uv_array : np.ndarray
+            The x and y positions of each UV point mapped to the mesh.
+        lookup_data : pl.DataFrame
+            The lookup table to match UV points with mesh verticies.
+        uv_tree : cKDTree
+            KD Tree of `uv_array` for nearest UV searches.
+        uv_to_vertex : np.ndarray
+            The vertex number of each UV row.
+        vertex_uv_offsets : np.ndarray
+            Where the UV row numbers of each vertex start in `vertex_uvs`.
+        vertex_uvs : np.ndarray
+            The UV row numbers of every vertex, grouped by vertex.
+        face_uvs : np.ndarray
+            The UV row number of each face corner.
+        face_areas : np.ndarray
+            The area of each face.
+
+        Raises
+        ------
+        KeyError
+            If there is no mesh data for `mesh_name`
+        ValueError
+            If the `resolution` level is not saved in the mesh data
+
+        See Also
+        --------
+        data_manager.load_mesh :
+            Loads in the mesh and creates the geodesic solver.
+
+        Notes
+        -----
+        Each mesh name and level has its own lock so threads asking for the
+        same unloaded level wait for one load instead of each loading it.
+        Threads asking for different meshes or levels load them at the same
+        time. After a load, the least recently used meshes are evicted until
+        `memory_usage` is within the `memory_budget`. The mesh that was just
+        loaded is never evicted.
+        '''
+        pass
+
+    def preload(self, mesh_names: Iterable[str],
+                resolutions: Iterable[int] = (0,)) -> None:
+        '''
+        Loads meshes ahead of their first use
+
+        Parameters
+        ----------
+        mesh_names : Iterable[str]
+            The names of the meshes to load
+        resolutions : Iterable[int], default: (0,)
+            The levels of each mesh to load
+
+        Raises
+        ------
+        KeyError
+            If there is no mesh data for one of the `mesh_names`
+        ValueError
+            If one of the `resolutions` is not saved in the mesh data
+        '''
+        pass
+
+
+def get_registry() -> MeshRegistry:
+    '''
+    Returns the registry shared by the whole process.
+
+    The registry is made with the default settings the first time it is
+    asked for.
+
+    Returns
+    -------
+    registry : MeshRegistry
+        The process wide mesh registry.
+    '''
+    pass
@@ -0,0 +1,307 @@
+'''
+Stores many geodesic paths in two flat arrays.
+
+Paths found by `GeodesicPath.calculate_paths` have a different number of
+points each. Instead of keeping a separate array for every path, all of the
+points are kept in one Nx3 buffer with an offsets array marking where each
+path starts and ends.
+
+Classes
+-------
+PathMapping : Read only dictionary view of a PathStore.
+PathStore : Ragged array of paths of 3D points.
+
+Notes
+-----
+Path i is made of the points from row ``offsets[i]`` up to but not including
+row ``offsets[i + 1]`` of the points buffer, so ``offsets`` always has one
+more value than there are paths and starts at 0.
+'''
+import numpy as np
+from collections.abc import Mapping
+from typing import Dict, Iterator, Sequence
+
+
+class PathStore():
+    '''
+    Ragged array of paths of 3D points.
+
+    Attributes
+    ----------
+    points : np.ndarray
+        A Nx3 float32 array of the points of every path one after another
+    offsets : np.ndarray
+        A 1D int64 array of the first row in `points` of each path followed by
+        the number of rows in `points`
+
+    Methods
+    -------
+    __init__(points, offsets)
+        Wraps existing points and offsets arrays
+    __getitem__(index)
+        Returns one path as a view of the points buffer
+    __iter__()
+        Iterates over each path in order
+    __len__()
+        Returns the number of paths
+    as_dict()
+        Returns a dictionary view keyed by path number strings
+    from_paths(paths)
+        Makes a store from a list of separate path arrays
+    lengths()
+        Finds the length of each path along its points
+    load(directory, mmap)
+        Loads a store saved with `save`
+    point_counts()
+        Returns the number of points in each path
+    save(directory)
+        Saves the store to a folder of .npy files
+    '''
+    def __init__(self, points: np.ndarray, offsets: np.ndarray) -> None:
+        '''
+        Wraps existing points and offsets arrays
+
+        Parameters
+        ----------
+        points : np.ndarray
+            A Nx3 array of the points of every path. It is converted to
+            float32 if it is not already.
+        offsets : np.ndarray
+            A 1D integer array of the first row of each path followed by N
+
+        Raises
+        ------
+        ValueError
+            If `points` is not Nx3, or if `offsets` does not start at 0, is
+            not increasing, or does not end at the number of points
+        '''
+        pass
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        '''
+        Returns one path as a view of the points buffer
+
+        Parameters
+        ----------
+        index : int
+            The number of the path starting from 0. Negative values count
+            from the last path.
+
+        Returns
+        -------
+        path : np.ndarray
+            A Mx3 view of the points of the path. Writing to it changes the
+            store.
+
+        Raises
+        ------
+        IndexError
+            If there is no path at `index`
+        '''
+        pass
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        '''
+        Iterates over each path in order
+
+        Yields
+        ------
+        path : np.ndarray
+            A Mx3 view of the points of each path
+        '''
+        pass
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of paths
+        '''
+        pass
+
+    def as_dict(self) -> "PathMapping":
+        '''
+        Returns a dictionary view keyed by path number strings
+
+        Returns
+        -------
+        path_mapping : PathMapping
+            A read only view that can be used anywhere the old
+            `Dict[str, np.ndarray]` of `GeodesicPath.found_paths` was used
+        '''
+        pass
+
+    @classmethod
+    def from_paths(cls, paths: Sequence[np.ndarray]) -> "PathStore":
+        '''
+        Makes a store from a list of separate path arrays
+
+        Parameters
+        ----------
+        paths : Sequence[np.ndarray]
+            The Mx3 arrays of each path in order
+
+        Returns
+        -------
+        path_store : PathStore
+            The paths copied into one points buffer
+        '''
+        pass
+
+    def lengths(self) -> np.ndarray:
+        '''
+        Finds the length of each path along its points
+
+        Returns
+        -------
+        path_lengths : np.ndarray
+            A 1D float64 array of the sum of the distances between the
+            neighboring points of each path. Paths with one point have a
+            length of 0.
+
+        Notes
+        -----
+        The distances between every pair of neighboring rows in `points` are
+        found at once and summed per path with `np.add.reduceat`. The
+        distances that cross from the end of one path to the start of the
+        next are left out.
+        '''
+        pass
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = False) -> "PathStore":
+        '''
+        Loads a store saved with `save`
+
+        Parameters
+        ----------
+        directory : str
+            The folder the store was saved to
+        mmap : bool, default: False
+            If True, the points and offsets are memory mapped read only
+            instead of being read into memory
+
+        Returns
+        -------
+        path_store : PathStore
+            The loaded paths
+
+        Raises
+        ------
+        FileNotFoundError
+            If `points.npy` or `offsets.npy` is not in `directory`
+
+        Notes
+        -----
+        Each array is its own .npy file, so `np.load` with ``mmap_mode="r"``
+        maps it straight from the file. This would not work with a .npz file,
+        as `np.load` reads the arrays of a .npz archive into memory even when
+        it is not compressed.
+        '''
+        pass
+
+    def point_counts(self) -> np.ndarray:
+        '''
+        Returns the number of points in each path
+
+        Returns
+        -------
+        counts : np.ndarray
+            A 1D integer array of the number of points in each path
+        '''
+        pass
+
+    def save(self, directory: str) -> None:
+        '''
+        Saves the store to a folder of .npy files
+
+        Parameters
+        ----------
+        directory : str
+            The folder to save `points.npy` and `offsets.npy` to. It is made
+            if it does not exist.
+
+        Notes
+        -----
+        The files are written to a temporary folder and renamed when done so
+        no reader sees a half written store.
+        '''
+        pass
+
+
+class PathMapping(Mapping):
+    '''
+    Read only dictionary view of a PathStore.
+
+    Keys are the path number strings `GeodesicPath.calculate_paths` has
+    always used and values are views of the points buffer of the store.
+
+    Attributes
+    ----------
+    path_store : PathStore
+        The store the view reads from
+
+    Methods
+    -------
+    __init__(path_store)
+        Makes a view of a store
+    to_dict()
+        Copies the view into a normal dictionary
+    '''
+    def __init__(self, path_store: PathStore) -> None:
+        '''
+        Makes a view of a store
+
+        Parameters
+        ----------
+        path_store : PathStore
+            The store to read from
+        '''
+        pass
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        '''
+        Returns one path as a view of the points buffer
+
+        Parameters
+        ----------
+        key : str
+            The path number as a string, such as `"0"`
+
+        Returns
+        -------
+        path : np.ndarray
+            A Mx3 view of the points of the path
+
+        Raises
+        ------
+        KeyError
+            If `key` is not the number of a path in the store
+        '''
+        pass
+
+    def __iter__(self) -> Iterator[str]:
+        '''
+        Iterates over the path number strings in order
+
+        Yields
+        ------
+        key : str
+            The number of each path as a string
+        '''
+        pass
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of paths
+        '''
+        pass
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        '''
+        Copies the view into a normal dictionary
+
+        Returns
+        -------
+        data_dict : Dict[str, np.ndarray]
+            A dictionary of a copy of each path labeled by a path number
+        '''
+        pass
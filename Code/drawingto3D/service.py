@@ -0,0 +1,381 @@
+'''
+Answers geodesic queries from asyncio code without blocking the event loop.
+
+Distance, path, and surface area requests are awaited from the event loop
+while the solves run in a bounded pool of worker processes. Requests for the
+same mesh, level, and starting vertex that arrive together share one solve.
+
+Classes
+-------
+GeodesicService : Asyncio front end for distance, path, and area queries.
+ServiceOverloaded : Raised when the service has too many waiting requests.
+
+Methods
+-------
+serve : Runs the service as a local JSON lines server.
+
+Notes
+-----
+The potpourri3d bindings do not release the GIL while they solve, so solves
+on threads would run one at a time. The solves are instead sent to a process
+pool in the same way as `GeodesicPath.calculate_paths`. Each worker process
+loads the meshes it is asked for into its own process wide `MeshRegistry`
+once and keeps them for the life of the pool. The registry of the service
+process is made without solvers and is only used to turn pixels into
+verticies before a request is sent, so only vertex numbers and results are
+sent between processes.
+'''
+from __future__ import annotations
+import asyncio
+import numpy as np
+from typing import List, Optional, Tuple, TYPE_CHECKING
+from drawingto3D.mesh_registry import MeshRegistry
+from drawingto3D.path_store import PathStore
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+class ServiceOverloaded(RuntimeError):
+    '''
+    Raised when the service has too many waiting requests.
+
+    Callers should retry later or return a busy response to their own clients.
+    '''
+    pass
+
+
+class GeodesicService():
+    '''
+    Asyncio front end for distance, path, and area queries.
+
+    Attributes
+    ----------
+    registry : MeshRegistry
+        The registry the meshes are loaded from
+    max_workers : int
+        The number of worker processes that run solves
+    max_pending : int
+        The most requests that can be waiting or running at once
+    default_timeout : float or None
+        The seconds a request may take when no timeout is given
+    pending : int
+        The number of requests waiting or running
+
+    Methods
+    -------
+    __init__(registry, max_workers, max_pending, default_timeout)
+        Sets up the service
+    close()
+        Waits for running requests and shuts down the worker processes
+    distances(sex, side, data, timeout, resolution)
+        Finds the geodesic distances between start and end centroids
+    paths(sex, side, data, timeout, resolution)
+        Finds the geodesic paths between start and end centroids
+    surface_area(sex, side, border_points, timeout, resolution)
+        Finds the surface area of a drawn location
+    '''
+    def __init__(self, registry: Optional[MeshRegistry] = None,
+                 max_workers: int = 4, max_pending: int = 256,
+                 default_timeout: Optional[float] = None) -> None:
+        '''
+        Sets up the service
+
+        Parameters
+        ----------
+        registry : MeshRegistry, optional
+            The registry to turn pixels into verticies with. If not given, a
+            registry with `make_solvers` set to False is made, as the solves
+            are never run in the service process. The worker processes load
+            their own copy of each mesh, with its solvers, from the same data
+            and cache folders.
+        max_workers : int, default: 4
+            The number of worker processes that run solves. Each one holds
+            its own copy of every mesh it has been asked about.
+        max_pending : int, default: 256
+            The most requests that can be waiting or running at once. Requests
+            past this raise `ServiceOverloaded` right away instead of waiting.
+        default_timeout : float, optional
+            The seconds a request may take when no timeout is given. If None,
+            requests have no deadline by default.
+        '''
+        pass
+
+    async def __aenter__(self) -> GeodesicService:
+        pass
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    @property
+    def pending(self) -> int:
+        '''
+        The number of requests waiting or running
+        '''
+        pass
+
+    async def close(self) -> None:
+        '''
+        Waits for running requests and shuts down the worker processes
+
+        New requests raise `ServiceOverloaded` once closing has started.
+        '''
+        pass
+
+    async def distances(self, sex: str, side: str, data: np.ndarray,
+                        timeout: Optional[float] = None,
+                        resolution: int = 0) -> np.ndarray:
+        '''
+        Finds the geodesic distances between start and end centroids
+
+        Parameters
+        ----------
+        sex : str
+            The visual sex of the mesh (Male or Female)
+        side : str
+            The arm of the model (right or left)
+        data : np.ndarray
+            A Nx4 array of start x, start y, end x, and end y centroid pixel
+            values
+        timeout : float, optional
+            The seconds the request may take. If not given, the
+            `default_timeout` is used.
+        resolution : int, default: 0
+            The level of the mesh to solve on, where 0 is the full mesh
+
+        Returns
+        -------
+        path_distances : np.ndarray
+            The found geodesic distances in order of the input data
+
+        Raises
+        ------
+        ServiceOverloaded
+            If `max_pending` requests are already waiting or running
+        asyncio.TimeoutError
+            If the request takes longer than its timeout
+        KeyError
+            If an unknown sex or side is given
+        ValueError
+            If the `resolution` level is not saved in the mesh data
+
+        Notes
+        -----
+        Each unique starting vertex of the request is looked up in a table of
+        solves already queued or running, keyed by the mesh name, the level,
+        and the vertex. Vertex numbers of different levels do not match, so
+        requests only share a solve when they are for the same level. If a
+        solve is found, the request waits on it instead of queuing its own. A
+        solve is only dropped from the table when it finishes, so a request
+        that times out does not cancel a solve other requests are waiting on.
+
+        Each solve returns the whole distance field of its starting vertex to
+        the service process, and every request waiting on it reads the
+        distances to its own ending verticies from that field. Requests that
+        share a start do not need to share their ends.
+        '''
+        pass
+
+    async def paths(self, sex: str, side: str, data: np.ndarray,
+                    timeout: Optional[float] = None,
+                    resolution: int = 0) -> PathStore:
+        '''
+        Finds the geodesic paths between start and end centroids
+
+        Parameters
+        ----------
+        sex : str
+            The visual sex of the mesh (Male or Female)
+        side : str
+            The arm of the model (right or left)
+        data : np.ndarray
+            A Nx4 array of start x, start y, end x, and end y centroid pixel
+            values
+        timeout : float, optional
+            The seconds the request may take
+        resolution : int, default: 0
+            The level of the mesh to find paths on, where 0 is the full mesh
+
+        Returns
+        -------
+        found_paths : PathStore
+            The found paths between the input data
+
+        Raises
+        ------
+        ServiceOverloaded
+            If `max_pending` requests are already waiting or running
+        asyncio.TimeoutError
+            If the request takes longer than its timeout
+        KeyError
+            If an unknown sex or side is given
+        ValueError
+            If the `resolution` level is not saved in the mesh data
+        '''
+        pass
+
+    async def surface_area(self, sex: str, side: str,
+                           border_points: pl.DataFrame,
+                           timeout: Optional[float] = None,
+                           resolution: int = 0) -> float:
+        '''
+        Finds the surface area of a drawn location
+
+        Parameters
+        ----------
+        sex : str
+            The visual sex of the mesh (Male or Female)
+        side : str
+            The arm of the model (right or left)
+        border_points : pl.DataFrame
+            The x and y pixel values of the border of the drawn location
+        timeout : float, optional
+            The seconds the request may take
+        resolution : int, default: 0
+            The level of the mesh to find the area on, where 0 is the full
+            mesh
+
+        Returns
+        -------
+        surface_area : float
+            The area of the faces fully covered by the drawn location
+
+        Raises
+        ------
+        ServiceOverloaded
+            If `max_pending` requests are already waiting or running
+        asyncio.TimeoutError
+            If the request takes longer than its timeout
+        KeyError
+            If an unknown sex or side is given
+        ValueError
+            If the `resolution` level is not saved in the mesh data
+
+        See Also
+        --------
+        surface.calculate_surface_area :
+            Finds the surface area of the faces covered by a set of UVs.
+
+        Notes
+        -----
+        The UV KD Tree, `face_uvs`, and `face_areas` are taken from the mesh
+        held by the registry of the worker process, so no mesh structure is
+        rebuilt per request.
+        The border pixels are scaled with the size of the location drawing of
+        the chosen side, as in `GeodesicPath`.
+        '''
+        pass
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765,
+                service: Optional[GeodesicService] = None) -> None:
+    '''
+    Runs the service as a local JSON lines server.
+
+    Each line sent to the server is a JSON object with a `type` of
+    `distances`, `paths`, or `surface_area`, the `sex` and `side` of the mesh,
+    the request `data`, and an optional `timeout` and `resolution`. Each reply
+    is a JSON object on one line with either a `result` or an `error`, and
+    the `id` of the request if one was given. Replies can come back out of
+    order.
+
+    Parameters
+    ----------
+    host : str, default: 127.0.0.1
+        The address to listen on
+    port : int, default: 8765
+        The port to listen on
+    service : GeodesicService, optional
+        The service to answer requests with. If not given, one is made with
+        the default settings.
+
+    Notes
+    -----
+    Run the server from the command line with
+    ``python -m drawingto3D.service``.
+    '''
+    pass
+
+
+def _init_service_worker(cache_directory: Optional[str]) -> None:
+    '''
+    Sets up the mesh registry of a worker process
+
+    Parameters
+    ----------
+    cache_directory : str or None
+        The folder of the mesh cache used by the registry of the service
+    '''
+    pass
+
+
+def _solve_distances(mesh_name: str, resolution: int,
+                     start_vertex: int) -> np.ndarray:
+    '''
+    Solves one distance field in a worker process
+
+    Parameters
+    ----------
+    mesh_name : str
+        The name of the mesh to solve on
+    resolution : int
+        The level of the mesh to solve on
+    start_vertex : int
+        The vertex number the field is solved from
+
+    Returns
+    -------
+    distance_field : np.ndarray
+        The distance from `start_vertex` to every vertex of the mesh
+    '''
+    pass
+
+
+def _solve_paths(mesh_name: str, resolution: int, vertex_pairs: np.ndarray
+                 ) -> List[Tuple[np.ndarray, float]]:
+    '''
+    Finds the paths of start and end verticies in a worker process
+
+    Parameters
+    ----------
+    mesh_name : str
+        The name of the mesh to find paths on
+    resolution : int
+        The level of the mesh to find paths on
+    vertex_pairs : np.ndarray
+        A Nx2 array of start and end vertex numbers
+
+    Returns
+    -------
+    found_paths : List[Tuple[np.ndarray, float]]
+        The Nx3 path points and the time in seconds to find each path in the
+        order of `vertex_pairs`
+    '''
+    pass
+
+
+def _solve_surface_area(mesh_name: str, resolution: int,
+                        border_points: np.ndarray) -> float:
+    '''
+    Finds the surface area of a drawn location in a worker process
+
+    Parameters
+    ----------
+    mesh_name : str
+        The name of the mesh the location was drawn on
+    resolution : int
+        The level of the mesh to find the area on
+    border_points : np.ndarray
+        A Nx2 array of the x and y pixel values of the border of the drawn
+        location
+
+    Returns
+    -------
+    surface_area : float
+        The area of the faces fully covered by the drawn location
+    '''
+    pass
+
+
+if __name__ == "__main__":
+    pass
@@ -4,26 +4,292 @@ Takes a location drawing and converts it into a 3D surface.
 Used the mesh data made for each sex and side of the body to take a location
 drawing from the drawing template and create a 3D surface connected to pyvista.
 
+Classes
+-------
+SurfaceExtractor : Finds the surfaces of many drawings on one mesh.
+
 Methods
 -------
+build_face_samples :
+    Finds the location drawing pixels to sample for each mesh face.
+calculate_surface_area :
+    Finds the surface area of the faces covered by a set of UVs.
 clean_uv_border : Removes any duplicated UV points in an array.
 convert_uv_to_vertex :
     Take the UVs in the location drawing and return the verticies surface.
 create_surface : Create a 3D surface from the location drawing verticies.
 find_enclosed_uvs : Find all UVs contained by the location drawing.
+find_enclosed_uvs_batch :
+    Find the UVs contained by each of many location drawings.
 find_uv_indicies :
     Converts the location drawing border pixels to the nearest UV values.
+mask_to_surface :
+    Selects the mesh faces covered by location drawing masks.
 
 Notes
 -----
 The surface created here is connected to
 `pyvista <https://docs.pyvista.org/version/stable/>`_ and can be used with any
 of the functions contained in that library.
+
+Each function records a timing span with `instrumentation` when it is turned
+on. Refer to that module for the span names.
 '''
-import polars as pl
+from __future__ import annotations
 import numpy as np
-import pyvista as pv
-from typing import List
+from typing import (Iterable, Iterator, List, Optional, Sequence,
+                    TYPE_CHECKING, Tuple, Union)
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyvista as pv
+    from scipy.spatial import cKDTree
+
+
+class SurfaceExtractor():
+    '''
+    Finds the surfaces of many drawings on one mesh.
+
+    Everything the surface functions need from the mesh is made once when the
+    extractor is made and reused for every drawing after.
+
+    Attributes
+    ----------
+    mesh_verticies : np.ndarray
+        A Vx3 array of each vertex value
+    faces : np.ndarray
+        A Fx3 array of the vertex row numbers of each face
+    face_uvs : np.ndarray
+        A Fx3 array of the UV row numbers of each face corner
+    uv_array : np.ndarray
+        Table of x, y positions of every uv point for the 3D mesh
+    image_x_size : int
+        The x dimension of the location drawing image in pixels
+    image_y_size : int
+        The y dimension of the location drawing image in pixels
+    uv_tree : cKDTree
+        KD Tree of `uv_array`
+    uv_to_vertex : np.ndarray
+        The vertex row number of each row of `uv_array`
+    face_areas : np.ndarray
+        The surface area of each face, found with
+        `data_manager.compute_face_areas`
+    face_samples : np.ndarray
+        The location drawing pixels sampled for each face by masks
+
+    Methods
+    -------
+    __init__(mesh_verticies, faces, face_uvs, uv_array, lookup_data,
+             image_x_size, image_y_size)
+        Makes the shared mesh structures
+    create_surface(selected_faces)
+        Builds the pyvista surface of a set of selected faces
+    extract(drawing)
+        Finds the faces and surface area of one drawing
+    extract_many(drawings, workers)
+        Finds the faces and surface area of many drawings
+    '''
+    def __init__(self, mesh_verticies: np.ndarray, faces: np.ndarray,
+                 face_uvs: np.ndarray, uv_array: np.ndarray,
+                 lookup_data: Union[pl.DataFrame, np.ndarray],
+                 image_x_size: int, image_y_size: int) -> None:
+        '''
+        Makes the shared mesh structures
+
+        Parameters
+        ----------
+        mesh_verticies : np.ndarray
+            A Vx3 array of each vertex value
+        faces : np.ndarray
+            A Fx3 array of the vertex row numbers of each face
+        face_uvs : np.ndarray
+            A Fx3 array of the UV row numbers of each face corner, as returned
+            by `data_manager.load_mesh`
+        uv_array : np.ndarray
+            Table of x, y positions of every uv point for the 3D mesh
+        lookup_data : pl.DataFrame or np.ndarray
+            The lookup table for finding which UVs go to which verticies, or
+            the `uv_to_vertex` array made by
+            `data_manager.build_uv_vertex_map`
+        image_x_size : int
+            The x dimension of the location drawing image in pixels
+        image_y_size : int
+            The y dimension of the location drawing image in pixels
+        '''
+        pass
+
+    def create_surface(self, selected_faces: np.ndarray) -> pv.PolyData:
+        '''
+        Builds the pyvista surface of a set of selected faces
+
+        Parameters
+        ----------
+        selected_faces : np.ndarray
+            A boolean array of length F from `extract`
+
+        Returns
+        -------
+        shell : pv.PolyData
+            The 3D mesh of the selected faces
+
+        Notes
+        -----
+        The faces are taken straight from the mesh, so no surface is
+        reconstructed from the verticies as is done by the module level
+        `surface.create_surface`.
+        '''
+        pass
+
+    def extract(self, drawing: Union[pl.DataFrame, np.ndarray]
+                ) -> Tuple[np.ndarray, float]:
+        '''
+        Finds the faces and surface area of one drawing
+
+        Parameters
+        ----------
+        drawing : pl.DataFrame or np.ndarray
+            The x and y pixel values of the border of a drawn location, or a
+            binary mask of the drawn location the size of the location
+            drawing
+
+        Returns
+        -------
+        selected_faces : np.ndarray
+            A boolean array of length F that is True for each face in the
+            drawn location
+        surface_area : float
+            The surface area of the drawn location
+
+        See Also
+        --------
+        calculate_surface_area :
+            Finds the surface area of the faces covered by a set of UVs.
+        mask_to_surface :
+            Selects the mesh faces covered by location drawing masks.
+
+        Notes
+        -----
+        Borders are run through `find_uv_indicies`, `clean_uv_border`, and
+        `find_enclosed_uvs` with the shared KD Tree, and the faces with all
+        three corner UVs inside are selected. Masks are run through
+        `mask_to_surface` with the shared face samples.
+        '''
+        pass
+
+    def extract_many(self,
+                     drawings: Iterable[Union[pl.DataFrame, np.ndarray]],
+                     workers: int = 1
+                     ) -> Iterator[Tuple[np.ndarray, float]]:
+        '''
+        Finds the faces and surface area of many drawings
+
+        Parameters
+        ----------
+        drawings : Iterable[pl.DataFrame or np.ndarray]
+            The borders or masks of each drawn location. This can be a
+            generator so the drawings do not all need to be in memory.
+        workers : int, default: 1
+            The number of threads to run `extract` on. With 1 worker, the
+            drawings are run in this thread.
+
+        Yields
+        ------
+        selected_faces : np.ndarray
+            A boolean array of length F for each drawing
+        surface_area : float
+            The surface area of each drawing
+
+        Notes
+        -----
+        Results are yielded in the order of `drawings`. With more than one
+        worker, at most twice `workers` drawings are read ahead of the last
+        result yielded, so memory use stays bounded on long inputs. The KD
+        Tree queries and numpy work release the GIL, so threads run in
+        parallel and share the mesh structures without copying them.
+        '''
+        pass
+
+
+def build_face_samples(face_uvs: np.ndarray, uv_array: np.ndarray,
+                       image_x_size: int, image_y_size: int,
+                       barycentric_weights: Optional[np.ndarray] = None
+                       ) -> np.ndarray:
+    '''
+    Finds the location drawing pixels to sample for each mesh face.
+
+    Places sample points inside the UV triangle of every face from a set of
+    barycentric weights and converts them to pixel positions on the location
+    drawing. This only needs to be done once per mesh and image size.
+
+    Parameters
+    ----------
+    face_uvs : np.ndarray
+        A Fx3 array of the UV row numbers of each face corner, as returned by
+        `data_manager.load_mesh`.
+    uv_array : np.ndarray
+        Table of x, y positions of every uv point for the 3D mesh.
+    image_x_size : int
+        The x dimension of the location drawing image in pixels
+    image_y_size : int
+        The y dimension of the location drawing image in pixels
+    barycentric_weights : np.ndarray, optional
+        A Sx3 array of the barycentric weights of each sample point. Each row
+        must add up to 1. If not given, each face is sampled at its center.
+
+    Returns
+    -------
+    face_samples : np.ndarray
+        A FxSx2 int array of the x and y pixel of each sample of each face.
+        Faces with UVs outside of the location drawing are marked with -1.
+
+    See Also
+    --------
+    mask_to_surface :
+        Selects the mesh faces covered by location drawing masks.
+    '''
+    pass
+
+
+def calculate_surface_area(uv_indicies: np.ndarray, face_uvs: np.ndarray,
+                           face_areas: np.ndarray) -> Tuple[float, float]:
+    '''
+    Finds the surface area of the faces covered by a set of UVs.
+
+    Parameters
+    ----------
+    uv_indicies : np.ndarray
+        The row values of the UVs that make up the location drawing.
+    face_uvs : np.ndarray
+        A Fx3 array of the UV row numbers of each face corner, as returned by
+        `data_manager.load_mesh`.
+    face_areas : np.ndarray
+        A 1D array of the surface area of each face of the mesh, as returned
+        by `data_manager.load_mesh`.
+
+    Returns
+    -------
+    surface_area : float
+        The summed area of the faces with all three corner UVs in
+        `uv_indicies`.
+    partial_area : float
+        The summed area of the faces with one or two corner UVs in
+        `uv_indicies`, each weighted by the fraction of its corners that are
+        covered.
+
+    See Also
+    --------
+    create_surface : Create a 3D surface from the location drawing verticies.
+    find_enclosed_uvs : Find all UVs contained by the location drawing.
+
+    Notes
+    -----
+    The covered corners of every face are counted with one boolean lookup of
+    `face_uvs`, and the areas are a masked sum of `face_areas`. No surface is
+    built, so use this instead of `create_surface` when only the area is
+    needed. Reporting `surface_area` and `surface_area + partial_area` gives
+    bounds on the area of the drawn location.
+    '''
+    pass
 
 
 def clean_uv_border(boundary_uv_array: np.ndarray) -> List[int]:
@@ -49,7 +315,8 @@ def clean_uv_border(boundary_uv_array: np.ndarray) -> List[int]:
     pass
 
 
-def convert_uv_to_vertex(uv_indicies: np.ndarray, lookup_data: pl.DataFrame,
+def convert_uv_to_vertex(uv_indicies: np.ndarray,
+                         lookup_data: Union[pl.DataFrame, np.ndarray],
                          mesh_verticies: np.ndarray) -> np.ndarray:
     '''
     Take the UVs in the location drawing and return the verticies surface.
@@ -62,8 +329,9 @@ def convert_uv_to_vertex(uv_indicies: np.ndarray, lookup_data: pl.DataFrame,
     ----------
     uv_indicies : np.ndarray
         The row values of the UVs that make up the location drawing.
-    lookup_data : pl.DataFrame
-        The lookup table for finding which UVs go to which verticies.
+    lookup_data : pl.DataFrame or np.ndarray
+        The lookup table for finding which UVs go to which verticies, or the
+        `uv_to_vertex` array made by `data_manager.build_uv_vertex_map`.
     mesh_verticies : np.ndarray
         A Nx3 array of each vertex value.
 
@@ -71,6 +339,13 @@ def convert_uv_to_vertex(uv_indicies: np.ndarray, lookup_data: pl.DataFrame,
     -------
     location_surface : np.ndarray
         A Nx3 array of each vertex that make up the drawn location in 3D.
+
+    Notes
+    -----
+    With a `uv_to_vertex` array, the verticies are found by indexing it with
+    `uv_indicies` and then indexing `mesh_verticies` with the unique results.
+    Make the array once per mesh when converting many drawings. Given a lookup
+    table, the array is made from it for this call only.
     '''
     pass
 
@@ -88,12 +363,23 @@ def create_surface(location_surface: np.ndarray) -> pv.PolyData:
     -------
     shell : pv.PolyData
         The 3D mesh from the location drawing.
+
+    See Also
+    --------
+    calculate_surface_area :
+        Finds the surface area of the faces covered by a set of UVs.
+
+    Notes
+    -----
+    Building the surface is only needed to visualize the drawn location. Use
+    `calculate_surface_area` to find the area without building a surface.
     '''
     pass
 
 
 def find_enclosed_uvs(uv_array: np.ndarray,
-                      clean_boundary_uv_array: List[int]) -> np.ndarray:
+                      clean_boundary_uv_array: List[int],
+                      uv_tree: Optional[cKDTree] = None) -> np.ndarray:
     '''
     Find all UVs contained by the location drawing.
 
@@ -103,6 +389,9 @@ def find_enclosed_uvs(uv_array: np.ndarray,
         Table of x, y positions of every uv point for the 3D mesh.
     clean_boundary_uv_array : List[int]
         A list of row numbers in the `uv_array` without duplicates.
+    uv_tree : cKDTree, optional
+        A KD Tree of `uv_array` made by `data_manager.build_uv_tree`. If not
+        given, the tree is made from `uv_array` for this call only.
 
     Returns
     -------
@@ -112,6 +401,8 @@ def find_enclosed_uvs(uv_array: np.ndarray,
     See Also
     --------
     clean_uv_border : Removes any duplicated UV points in an array.
+    find_enclosed_uvs_batch :
+        Find the UVs contained by each of many location drawings.
     find_uv_indicies :
         Converts the location drawing border pixels to the nearest UV values.
 
@@ -120,12 +411,56 @@ def find_enclosed_uvs(uv_array: np.ndarray,
     Uses the drawn location to bored an enclosed border around a region on the
     UV map. Then finds all the UVs inside of the border for use in extracting
     that portion of the mesh from the 3D model.
+
+    Only the UVs inside the bounding box of the border are tested. These are
+    found with a single ball query of the KD Tree using the infinity norm,
+    whose ball is a square that covers the bounding box, and then trimmed to
+    the box. The candidates are tested against every edge of the border at
+    once with the even-odd rule, so the cost depends on the size of the
+    drawing and not on the number of UVs in the whole map.
+    '''
+    pass
+
+
+def find_enclosed_uvs_batch(uv_array: np.ndarray,
+                            clean_boundary_uv_arrays: Sequence[List[int]],
+                            uv_tree: Optional[cKDTree] = None
+                            ) -> List[np.ndarray]:
+    '''
+    Find the UVs contained by each of many location drawings.
+
+    Parameters
+    ----------
+    uv_array : np.ndarray
+        Table of x, y positions of every uv point for the 3D mesh.
+    clean_boundary_uv_arrays : Sequence[List[int]]
+        The border of each location drawing as row numbers in the `uv_array`
+        without duplicates.
+    uv_tree : cKDTree, optional
+        A KD Tree of `uv_array` made by `data_manager.build_uv_tree`. If not
+        given, the tree is made from `uv_array` once for all of the drawings.
+
+    Returns
+    -------
+    combined_uv_indicies : List[np.ndarray]
+        Row numbers of UV values inside of and on each location drawing in the
+        order of `clean_boundary_uv_arrays`.
+
+    See Also
+    --------
+    find_enclosed_uvs : Find all UVs contained by the location drawing.
+
+    Notes
+    -----
+    The bounding box candidates of every drawing are found with one call to
+    the KD Tree before the containment test is run on each drawing.
     '''
     pass
 
 
 def find_uv_indicies(border_points: pl.DataFrame, uv_array: np.ndarray,
-                     image_x_size: int, image_y_size: int) -> np.ndarray:
+                     image_x_size: int, image_y_size: int,
+                     uv_tree: Optional[cKDTree] = None) -> np.ndarray:
     '''
     Converts the location drawing border pixels to the nearest UV values.
 
@@ -136,14 +471,89 @@ def find_uv_indicies(border_points: pl.DataFrame, uv_array: np.ndarray,
     ----------
     border_points : np.ndarray
         The x and y pixel values of a border point
+    uv_array : np.ndarray
+        Table of x, y positions of every uv point for the 3D mesh.
     image_x_size : int
         The x dimension of the location drawing image in pixels
     image_y_size : int
         The y dimension of the location drawing image in pixels
+    uv_tree : cKDTree, optional
+        A KD Tree of `uv_array` made by `data_manager.build_uv_tree`. If not
+        given, the tree is made from `uv_array` for this call only.
 
     Returns
     -------
     border_uvs : np.ndarray
         The row numbers of the closest uv to the 2D border point list
+
+    See Also
+    --------
+    data_manager.pixels_to_uv_indicies :
+        Finds the nearest UV to each of a set of location drawing pixels.
+
+    Notes
+    -----
+    All border points are searched for in a single query of the tree. Pass in
+    a tree made once per mesh when finding the border of many drawings.
+    '''
+    pass
+
+
+def mask_to_surface(masks: np.ndarray, face_samples: np.ndarray,
+                    face_areas: np.ndarray, threshold: float = 0.5
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Selects the mesh faces covered by location drawing masks.
+
+    Reads the mask value at every sample of every face in one gather and
+    keeps the faces where enough of the samples are inside the drawing.
+
+    Parameters
+    ----------
+    masks : np.ndarray
+        A binary mask of the drawn location with the same size as the location
+        drawing, or a MxHxW stack of M masks.
+    face_samples : np.ndarray
+        The sample pixels of each face made by `build_face_samples`.
+    face_areas : np.ndarray
+        A 1D array of the surface area of each face of the mesh, as returned
+        by `data_manager.load_mesh`.
+    threshold : float, default: 0.5
+        The fraction of the samples of a face that must be inside the drawing
+        for the face to be selected.
+
+    Returns
+    -------
+    selected_faces : np.ndarray
+        A boolean array of length F, or MxF for a stack of masks, that is True
+        for each face in the drawn location.
+    surface_area : np.ndarray
+        The surface area of the drawn location, or of each mask for a stack
+        of masks, in the units of the mesh squared.
+
+    Raises
+    ------
+    ValueError
+        If a sample of `face_samples` lies outside of the masks, other than
+        the -1 marked samples
+
+    See Also
+    --------
+    build_face_samples :
+        Finds the location drawing pixels to sample for each mesh face.
+
+    Notes
+    -----
+    Samples marked with -1 by `build_face_samples` are left out before the
+    masks are indexed, as ``mask[-1, -1]`` would read the last pixel of the
+    mask instead of failing. A face with every sample marked is never
+    selected, and for the other faces `threshold` is a fraction of the
+    samples that are not marked.
+
+    No border tracing, UV search, or surface building is done, so the cost of
+    each mask is one index into it with `face_samples` and a sum over faces.
+    Faces smaller than a pixel on the location drawing can be missed or
+    selected by a single sample, so the area has an error on the order of the
+    drawing border length times the size of a pixel on the mesh.
     '''
     pass